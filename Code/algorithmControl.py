@@ -1,6 +1,7 @@
+import traceback
 import pygame
-from Code import config
 from Code import helpFunctions
+from Code.solverThread import SolverThread
 
 # Display algorithm selector overlay
 def select_algorithm(state):
@@ -10,53 +11,68 @@ def select_algorithm(state):
 def hide_algo_selector(state):
     state["show_algo_selector"] = False
 
-# Trigger solving using selected algorithm
-def select_algorithm_callback(state, algo_func, SCREEN, FONT):
-    # Render waiting UI
-    SCREEN.fill('#000000')
-    if state["board_renderer"]:
-        state["board_renderer"].draw(SCREEN)
-
-    # Draw semi-transparent overlay
-    overlay = pygame.Surface((SCREEN.get_width(), SCREEN.get_height()))
-    overlay.set_alpha(220)
-    overlay.fill((0, 0, 0))
-    SCREEN.blit(overlay, (0, 0))
-
-    # Show "Searching..." message on screen
-    waiting_text_surface = FONT.render("Searching...", True, (255, 255, 255)).convert_alpha()
-    waiting_text_rect = waiting_text_surface.get_rect(center = (398, 300))
-    SCREEN.blit(waiting_text_surface, waiting_text_rect)
-    pygame.display.flip()
-
+# Trigger solving using selected algorithm: the search runs in a background thread
+# while the main loop keeps rendering its progress
+def select_algorithm_callback(state, algo_func):
     # Set current selected algorithm in state
     state["current_solver"] = algo_func
     state["selected_algorithm"] = algo_func
     state["show_algo_selector"] = False
 
-    # Run the algorithm and store results
+    # Start the algorithm on the selected level
     if state["board_renderer"]:
         # Load game board from file based on selected level
         file_name = f"Map/gameboard{state['selected_level']}.json"
         gameboard = helpFunctions.load_gameboard(file_name)
 
-        # Special case for DLS algorithm (requires depth limit)
-        if algo_func.__name__ == 'dls_algorithm':
-            result = algo_func(gameboard, config.MAX_LIMIT)
-        else:
-            result = algo_func(gameboard)
-
-        # Unpack result into game state variables
-        (state["list_boardgame"], state["time_execution"], state["peak_memory"],
-         state["expanded_nodes"], state["total_moves"], state["total_cost"]) = result
-
-        # If algorithm failed to find a solution
-        if not state["list_boardgame"]:
-            state["no_solution_flag"] = True
-            state["no_solution_time"] = pygame.time.get_ticks()
-            state["execute_algorithm_flag"] = False
-            return
-
-        # Prepare to execute algorithm step-by-step
-        state["current_step_index"] = 0
-        state["execute_algorithm_flag"] = True
+        # Never run two searches at once: let a cancelled one finish stopping first
+        if state["cancelled_thread"] is not None:
+            state["cancelled_thread"].join()
+            state["cancelled_thread"] = None
+
+        state["solver_thread"] = SolverThread(algo_func, gameboard)
+        state["solver_thread"].start()
+
+# Stop the running search and return to the board
+def cancel_search(state):
+    if state["solver_thread"]:
+        state["solver_thread"].cancel()
+        state["cancelled_thread"] = state["solver_thread"]
+        state["solver_thread"] = None
+
+# Called every frame: store the results of a finished search in the game state
+def poll_solver(state):
+    thread = state["solver_thread"]
+    if thread is None or thread.is_alive():
+        return
+
+    state["solver_thread"] = None
+
+    # A search that raised is reported (and shown as failed) instead of closing the GUI
+    state["search_failed"] = thread.error is not None
+    if thread.error is not None:
+        traceback.print_exception(thread.error)
+        state["no_solution_flag"] = True
+        state["no_solution_time"] = pygame.time.get_ticks()
+        state["execute_algorithm_flag"] = False
+        return
+
+    # Unpack result into game state variables
+    (state["list_boardgame"], state["time_execution"], state["peak_memory"],
+     state["expanded_nodes"], state["total_moves"], state["total_cost"]) = thread.result
+
+    state["metrics_mode"] = thread.result.stats["metrics"]
+
+    # A cached result shows the time and memory of the search that stored it
+    state["cached_result"] = thread.result.stats.get("cached", False)
+
+    # If algorithm failed to find a solution
+    if not state["list_boardgame"]:
+        state["no_solution_flag"] = True
+        state["no_solution_time"] = pygame.time.get_ticks()
+        state["execute_algorithm_flag"] = False
+        return
+
+    # Prepare to execute algorithm step-by-step
+    state["current_step_index"] = 0
+    state["execute_algorithm_flag"] = True
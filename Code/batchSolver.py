@@ -0,0 +1,220 @@
+import os
+import sys
+import json
+import glob
+import time
+import signal
+import inspect
+import argparse
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from Code import config
+from Code import helpFunctions
+from Code.searchAlgorithms import ALGORITHMS
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: memory limits are disabled there
+    resource = None
+
+# Seconds a worker may overrun the per-puzzle timeout before its puzzle is reported lost
+# (covers searches stuck where the timer cannot interrupt them)
+GRACE_PERIOD = 5.0
+
+# Raised inside a worker when a puzzle exceeds its time budget
+class PuzzleTimeout(Exception):
+    pass
+
+# Interrupt the running puzzle when its timer fires
+def raise_timeout(signum, frame):
+    raise PuzzleTimeout()
+
+# Prepare a worker process: cap its address space so a puzzle that runs out of
+# memory raises MemoryError instead of taking the machine down, and select how
+# searches measure themselves
+def init_worker(memory_limit, metrics=None):
+    if metrics:
+        config.METRICS_MODE = metrics
+    if memory_limit and resource is not None:
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+# Solve one level file in a worker and describe the outcome as a JSON-ready dictionary
+def solve_file(file_name, algorithm, timeout, options):
+    record = {"file": file_name, "algorithm": algorithm}
+    algo_func = ALGORITHMS[algorithm]
+
+    # Only pass the options the algorithm accepts (e.g. heuristic is for A* / IDA*)
+    parameters = inspect.signature(algo_func).parameters
+    kwargs = {name: value for name, value in options.items() if value is not None and name in parameters}
+
+    timer = timeout and hasattr(signal, "setitimer")
+    if timer:
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    start = time.perf_counter()
+    try:
+        gameboard = helpFunctions.load_gameboard(file_name)
+        result = algo_func(gameboard, **kwargs)
+        path, search_time, peak, expanded_nodes, total_moves, total_cost = result
+
+        record.update({"status": "solved" if path else "unsolvable", "time": search_time,
+                       "peak_memory": peak, "expanded_nodes": expanded_nodes,
+                       "total_moves": total_moves, "total_cost": total_cost,
+                       "moves": helpFunctions.path_to_moves(path) if path else None,
+                       "stats": getattr(result, "stats", {})})
+    except PuzzleTimeout:
+        record.update({"status": "timeout", "time": time.perf_counter() - start})
+    except MemoryError:
+        record.update({"status": "out_of_memory", "time": time.perf_counter() - start})
+    except Exception as error:
+        record.update({"status": "error", "error": f"{type(error).__name__}: {error}", "time": time.perf_counter() - start})
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        # An interrupted search never stops its own memory tracing
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    return record
+
+# Expand the command line inputs (level files or directories of them) into file names
+def collect_files(inputs):
+    files = []
+    for name in inputs:
+        if os.path.isdir(name):
+            files.extend(sorted(glob.glob(os.path.join(name, "*.json")), key=natural_key))
+        else:
+            files.extend(sorted(glob.glob(name), key=natural_key) or [name])
+    return files
+
+# Sort key putting "gameboard2.json" before "gameboard10.json"
+def natural_key(file_name):
+    digits = "".join(c for c in os.path.basename(file_name) if c.isdigit())
+    return (os.path.dirname(file_name), int(digits) if digits else -1, file_name)
+
+# Run solve_file on every (file name, algorithm, options) task with a pool of worker
+# processes, yielding (task index, record) pairs in completion order. At most
+# `workers` tasks run at once, so a task starts when it is submitted; with
+# `fresh_workers`, every task gets a new worker process. A worker that dies (e.g.
+# killed by the operating system) breaks the pool: if several tasks were running,
+# they are retried one at a time in a new pool, and a task that breaks the pool while
+# running alone is reported lost. A task that overruns its timeout by GRACE_PERIOD is
+# reported lost too, and the pool is replaced.
+def solve_tasks(tasks, workers=None, timeout=None, memory_limit=None, metrics=None, fresh_workers=False):
+    workers = workers or os.cpu_count() or 1
+    waiting = deque(range(len(tasks)))  # Tasks not started yet
+    suspects = deque()                # Tasks running when a worker died, retried alone
+
+    def lost(index):
+        file_name, algorithm, _ = tasks[index]
+        return index, {"file": file_name, "algorithm": algorithm, "status": "lost"}
+
+    while waiting or suspects:
+        pool = ProcessPoolExecutor(workers, initializer=init_worker, initargs=(memory_limit, metrics),
+                                   max_tasks_per_child=1 if fresh_workers else None)
+        running = {}                  # Future -> (task index, start time)
+        broken = False
+        try:
+            while (waiting or suspects or running) and not broken:
+                # Suspects run alone, other tasks keep every worker busy
+                while (suspects or waiting) and len(running) < (1 if suspects else workers):
+                    index = suspects.popleft() if suspects else waiting.popleft()
+                    file_name, algorithm, options = tasks[index]
+                    future = pool.submit(solve_file, file_name, algorithm, timeout, options)
+                    running[future] = (index, time.time())
+
+                done, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        broken = True
+                        continue
+
+                    index, _ = running.pop(future)
+                    try:
+                        record = future.result()
+                    except Exception as error:
+                        file_name, algorithm, _ = tasks[index]
+                        record = {"file": file_name, "algorithm": algorithm, "status": "error",
+                                  "error": f"{type(error).__name__}: {error}"}
+                    yield index, record
+
+                # A dead worker fails every running task: a lone one is to blame,
+                # otherwise each of them is retried alone
+                if broken:
+                    if len(running) == 1:
+                        index, _ = running.popitem()[1]
+                        yield lost(index)
+                    else:
+                        suspects.extend(index for index, _ in running.values())
+                        running.clear()
+
+                # A task still running well past its timeout is stuck where the timer
+                # cannot interrupt it: give it up and restart the others in a new pool
+                elif timeout:
+                    now = time.time()
+                    overdue = [future for future, (_, start) in running.items() if now - start > timeout + GRACE_PERIOD]
+                    if overdue:
+                        for future in overdue:
+                            index, _ = running.pop(future)
+                            yield lost(index)
+                        waiting.extendleft(reversed([index for index, _ in running.values()]))
+                        running.clear()
+                        broken = True
+        finally:
+            # The executor cannot stop running tasks: terminate the workers of a pool given
+            # up (or interrupted), so shutting it down does not wait for them
+            if broken or running:
+                for process in list((pool._processes or {}).values()):
+                    process.terminate()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+# Solve every file with a pool of worker processes (see solve_tasks), streaming one
+# JSON line per puzzle (in completion order) to `output`. Returns the number of solved puzzles.
+def run_batch(files, algorithm, workers=None, timeout=None, memory_limit=None, options=None, output=sys.stdout,
+              metrics=None):
+    tasks = [(file_name, algorithm, options or {}) for file_name in files]
+    solved = 0
+
+    for _, record in solve_tasks(tasks, workers, timeout, memory_limit, metrics):
+        solved += record["status"] == "solved"
+        output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+
+    return solved
+
+# Command line entry point: python -m Code.batchSolver Map --algorithm A_star_algorithm
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve Rush Hour level files without the GUI.")
+    parser.add_argument("inputs", nargs="+", help="level files, glob patterns or directories of *.json levels")
+    parser.add_argument("--algorithm", default="A_star_algorithm", choices=sorted(ALGORITHMS))
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds allowed per puzzle")
+    parser.add_argument("--memory-limit", type=int, default=None, help="megabytes of memory per worker")
+    parser.add_argument("--action-model", choices=["step", "slide"], default=None)
+    parser.add_argument("--cost-model", choices=["length", "unit"], default=None)
+    parser.add_argument("--heuristic", choices=["blockers", "blocking_chain", "pattern_database"], default=None)
+    parser.add_argument("--metrics", choices=["fast", "detailed"], default=None,
+                        help="time and memory measures (default: config.METRICS_MODE)")
+    parser.add_argument("--output", default=None, help="JSON lines file (default: standard output)")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.inputs)
+    options = {"action_model": args.action_model, "cost_model": args.cost_model, "heuristic": args.heuristic}
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        start = time.time()
+        solved = run_batch(files, args.algorithm, args.workers, args.timeout, args.memory_limit, options, output,
+                           args.metrics)
+        print(f"Solved {solved}/{len(files)} puzzles in {time.time() - start:.2f}s", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+from Code import config
+from Code.metrics import MEMORY_LABELS
+from Code.searchAlgorithms import ALGORITHMS
+from Code.batchSolver import solve_tasks, collect_files
+from Code.puzzleGenerator import write_puzzles
+
+# Default relative change (10%) beyond which a slower, hungrier or bigger search is a regression
+THRESHOLD = 0.10
+
+# Runs faster than this (seconds) are too noisy for their time to be compared
+MIN_TIME = 0.05
+
+# Algorithms stopped by a deadline: their cost and expanded nodes depend on the
+# machine's speed, so they are left out of the default set and only their time and
+# memory are compared
+DEADLINE_ALGORITHMS = ("anytime_A_star_algorithm",)
+
+# Generated puzzles added to every run, so reports also cover boards unlike the
+# hand-made levels. The seed and options are fixed: a given count always gives the
+# same files (generated01.json, ...), and a larger count only adds puzzles.
+GENERATED_COUNT = 10
+GENERATED_SEED = 1
+GENERATED_OPTIONS = {"width": 6, "height": 6, "walls": 0, "min_vehicles": 8, "max_vehicles": 13,
+                     "lengths": [2, 2, 3], "hardest": False, "min_cost": 30,
+                     "action_model": "step", "cost_model": "length"}
+
+# Key of a benchmark case: the same case in two reports is compared
+def case_key(result):
+    return (os.path.basename(result["file"]), result["algorithm"], result["action_model"], result["cost_model"])
+
+# Summarize the repeated runs of one case: median and fastest time, and the
+# measurements that do not depend on timing (taken from the first run)
+def summarize(file_name, algorithm, action_model, cost_model, records):
+    first = records[0]
+    summary = {"file": file_name, "algorithm": algorithm, "action_model": action_model, "cost_model": cost_model,
+               "status": first["status"], "runs": len(records), "metrics": first.get("stats", {}).get("metrics")}
+
+    # A case is only measured if every repetition finished
+    if any(record["status"] not in ("solved", "unsolvable") for record in records):
+        summary["status"] = next(record["status"] for record in records if record["status"] not in ("solved", "unsolvable"))
+        return summary
+
+    times = [record["time"] for record in records]
+    median = statistics.median(times)
+    summary.update({"times": times, "time": median, "min_time": min(times),
+                    "expanded_nodes": first["expanded_nodes"],
+                    "nodes_per_second": first["expanded_nodes"] / median if median > 0 else None,
+                    "peak_memory": max(record["peak_memory"] for record in records),
+                    "total_moves": first["total_moves"], "total_cost": first["total_cost"]})
+    return summary
+
+# Run every algorithm on every level file under every (action model, cost model)
+# pair, `repeat` times each, and return the benchmark report. Every run gets a fresh
+# worker process, so caches kept in memory between searches never help a repetition.
+def run_benchmark(files, algorithms, models, repeat=3, timeout=None, memory_limit=None, workers=1,
+                  metrics=None, progress=sys.stderr):
+    cases = [(file_name, algorithm, action_model, cost_model)
+             for file_name in files for algorithm in algorithms for action_model, cost_model in models]
+
+    # Every repetition is a task of its own; dead or stuck workers are handled by solve_tasks
+    tasks = [(file_name, algorithm, {"action_model": action_model, "cost_model": cost_model})
+             for file_name, algorithm, action_model, cost_model in cases for _ in range(repeat)]
+    records = [None] * len(tasks)
+    remaining = [repeat] * len(cases)  # Repetitions of every case still running
+    results = [None] * len(cases)
+
+    for index, record in solve_tasks(tasks, workers, timeout, memory_limit, metrics, fresh_workers=True):
+        records[index] = record
+        case = index // repeat
+        remaining[case] -= 1
+        if remaining[case] == 0:
+            results[case] = summarize(*cases[case], records[case * repeat:(case + 1) * repeat])
+            if progress is not None:
+                print(format_result(results[case]), file=progress, flush=True)
+
+    return {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+            "platform": platform.platform(), "processor": platform.processor(), "repeat": repeat,
+            "timeout": timeout, "metrics": metrics or config.METRICS_MODE, "results": results}
+
+# Write the first `count` puzzles of the generated set to `directory` and return their files
+def write_generated_set(directory, count, workers=None):
+    return [file_name for file_name, _ in write_puzzles(directory, count, GENERATED_OPTIONS, workers,
+                                                        GENERATED_SEED, "generated")]
+
+# One line describing a benchmark case
+def format_result(result):
+    name = f"{os.path.basename(result['file'])} {result['algorithm']} [{result['action_model']}/{result['cost_model']}]"
+    if "time" not in result:
+        return f"{name}: {result['status']}"
+    return (f"{name}: {result['status']}, {result['time']:.3f}s, {result['expanded_nodes']} nodes, "
+            f"{result['nodes_per_second'] or 0:.0f} nodes/s, "
+            f"{MEMORY_LABELS.get(result.get('metrics'), MEMORY_LABELS['detailed'])}: {result['peak_memory'] / (1024 * 1024):.2f} MB, "
+            f"{result['total_moves']} moves")
+
+# Compare two benchmark reports. Returns one (case, problem) pair per regression:
+#   - a case that finished before and no longer does
+#   - a different status or solution cost (the search is not returning the same quality)
+#   - more expanded nodes
+#   (cost and expanded nodes are not compared for DEADLINE_ALGORITHMS)
+#   - fastest time (the least noisy one) or peak memory grown by more than the threshold
+def compare_reports(baseline, current, threshold=THRESHOLD, min_time=MIN_TIME):
+    before = {case_key(result): result for result in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        key = case_key(result)
+        old = before.get(key)
+        if old is None or "time" not in old:
+            continue
+
+        if "time" not in result:
+            regressions.append((key, f"{old['status']} -> {result['status']}"))
+            continue
+
+        if result["status"] != old["status"]:
+            regressions.append((key, f"{old['status']} -> {result['status']}"))
+        if result["algorithm"] not in DEADLINE_ALGORITHMS:
+            if result["total_cost"] != old["total_cost"]:
+                regressions.append((key, f"cost {old['total_cost']} -> {result['total_cost']}"))
+            if result["expanded_nodes"] > old["expanded_nodes"]:
+                regressions.append((key, f"expanded nodes {old['expanded_nodes']} -> {result['expanded_nodes']}"))
+        if max(result["min_time"], old["min_time"]) >= min_time and result["min_time"] > old["min_time"] * (1 + threshold):
+            regressions.append((key, f"time {old['min_time']:.3f}s -> {result['min_time']:.3f}s"))
+        if result["peak_memory"] > old["peak_memory"] * (1 + threshold):
+            regressions.append((key, f"peak memory {old['peak_memory']} -> {result['peak_memory']} bytes"))
+
+    return regressions
+
+# Print the time ratio of every case of two reports, then the regressions
+def print_comparison(baseline, current, regressions, output=sys.stdout):
+    before = {case_key(result): result for result in baseline["results"]}
+    for result in current["results"]:
+        old = before.get(case_key(result))
+        if old is not None and "time" in old and "time" in result and old["time"] > 0:
+            print(f"{' '.join(map(str, case_key(result)))}: {old['time']:.3f}s -> {result['time']:.3f}s "
+                  f"(x{result['time'] / old['time']:.2f})", file=output)
+
+    print(f"{len(regressions)} regression(s)", file=output)
+    for key, problem in regressions:
+        print(f"  REGRESSION {' '.join(map(str, key))}: {problem}", file=output)
+
+# Read a benchmark report
+def load_report(file_name):
+    with open(file_name) as file:
+        return json.load(file)
+
+# Command line entry point:
+#   python -m Code.benchmark run Map --repeat 3 --output bench.json [--baseline old.json]
+#   python -m Code.benchmark compare old.json new.json
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Rush Hour search algorithms.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark and write a JSON report")
+    run.add_argument("inputs", nargs="*", default=["Map"], help="level files, glob patterns or directories (default: Map)")
+    run.add_argument("--algorithms", default=",".join(sorted(set(ALGORITHMS) - set(DEADLINE_ALGORITHMS))),
+                     help="comma separated algorithm names (default: all but the deadline-bounded ones)")
+    run.add_argument("--action-models", default="step", help="comma separated action models (step, slide)")
+    run.add_argument("--cost-models", default="length", help="comma separated cost models (length, unit)")
+    run.add_argument("--generated", type=int, default=GENERATED_COUNT,
+                     help=f"puzzles of the fixed-seed generated set to add (default: {GENERATED_COUNT}, 0: none)")
+    run.add_argument("--generated-dir", default=None,
+                     help="directory to keep the generated puzzles in (default: a temporary one)")
+    run.add_argument("--repeat", type=int, default=3, help="runs of every case")
+    run.add_argument("--timeout", type=float, default=60.0, help="seconds allowed per run")
+    run.add_argument("--memory-limit", type=int, default=None, help="megabytes of memory per run")
+    run.add_argument("--workers", type=int, default=1, help="runs in parallel (more than 1 skews timings)")
+    run.add_argument("--metrics", choices=["fast", "detailed"], default=None,
+                     help="time and memory measures (default: config.METRICS_MODE)")
+    run.add_argument("--output", default="benchmark.json", help="JSON report file")
+    run.add_argument("--baseline", default=None, help="report to compare the new one with")
+    run.add_argument("--threshold", type=float, default=THRESHOLD, help="relative change counted as a regression")
+
+    compare = commands.add_parser("compare", help="compare two JSON reports")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=THRESHOLD, help="relative change counted as a regression")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        algorithms = args.algorithms.split(",")
+        unknown = [name for name in algorithms if name not in ALGORITHMS]
+        if unknown:
+            parser.error(f"unknown algorithms: {', '.join(unknown)}")
+
+        models = [(action_model, cost_model) for action_model in args.action_models.split(",")
+                  for cost_model in args.cost_models.split(",")]
+        with tempfile.TemporaryDirectory() as temporary_dir:
+            files = collect_files(args.inputs)
+            if args.generated > 0:
+                files += write_generated_set(args.generated_dir or temporary_dir, args.generated, args.workers)
+
+            current = run_benchmark(files, algorithms, models, args.repeat,
+                                    args.timeout, args.memory_limit, args.workers, args.metrics)
+            current["generated"] = {"count": args.generated, "seed": GENERATED_SEED, "options": GENERATED_OPTIONS}
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=1)
+
+        if args.baseline is None:
+            return 0
+        baseline = load_report(args.baseline)
+    else:
+        baseline, current = load_report(args.baseline), load_report(args.current)
+
+    # Exit status 1 tells CI that performance regressed
+    regressions = compare_reports(baseline, current, args.threshold)
+    print_comparison(baseline, current, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,501 @@
+import math
+from Code import config
+from Code.gameboard import Gameboard
+
+# Bitboard encodes every state of one level as a single integer:
+#   - the low (width * height) bits are the occupancy mask (bit y * width + x);
+#     wall cells are always set, so no move can enter them
+#   - above them, every vehicle slot owns a fixed-width field holding its position
+#     along its lane (x for horizontal vehicles, y for vertical vehicles)
+# All tables that depend only on the level are computed once in the constructor,
+# so move legality, goal tests and hashing are plain integer operations whatever
+# the board size (positions take 3 bits up to 8x8 boards, 4 bits up to 16x16).
+class Bitboard():
+
+    # Constructor of Bitboard class
+    def __init__(self, gameboard: Gameboard, action_model=None, cost_model=None):
+        self.action_model = action_model or config.ACTION_MODEL     # "step" or "slide"
+        self.cost_model = cost_model or config.COST_MODEL           # "length" or "unit"
+        if self.action_model not in ("step", "slide"):
+            raise ValueError(f"Unknown action model: {self.action_model}")
+        if self.cost_model not in ("length", "unit"):
+            raise ValueError(f"Unknown cost model: {self.cost_model}")
+        self.slide = self.action_model == "slide"
+
+        self.width = gameboard.width                        # Width of the game board
+        self.height = gameboard.height                      # Height of the game board
+        self.walls = gameboard.walls                        # (x, y) cells no vehicle may enter
+        self.table = gameboard.table                        # Static vehicle table, indexed by slot
+        self.cell_count = self.width * self.height          # Number of occupancy bits
+        self.board_mask = (1 << self.cell_count) - 1        # Selects the occupancy bits of a state
+
+        # Occupancy bits of the walls, set in every state
+        self.wall_mask = 0
+        for x, y in self.walls:
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise ValueError(f"Wall ({x}, {y}) is outside the {self.width}x{self.height} board")
+            self.wall_mask |= 1 << (y * self.width + x)
+
+        # Number of bits needed to store any position along a lane
+        self.position_bits = max(1, (max(self.width, self.height) - 1).bit_length())
+        self.position_mask = (1 << self.position_bits) - 1
+
+        self.shifts = []            # Bit offset of each slot's position field
+        self.units = []             # Value added to a state to move a slot forward by one cell
+        self.limits = []            # Largest legal position of each slot
+        self.cell_masks = []        # cell_masks[slot][pos] -> cells covered by the vehicle at pos
+        self.back_cells = []        # back_cells[slot][pos] -> cell entered when moving from pos to pos - 1
+        self.forward_cells = []     # forward_cells[slot][pos] -> cell entered when moving from pos to pos + 1
+        self.back_toggles = []      # Occupancy bits flipped by a backward move from pos
+        self.forward_toggles = []   # Occupancy bits flipped by a forward move from pos
+        self.cell_candidates = [[] for _ in range(self.cell_count)]  # Slots whose lane crosses each cell
+        self.back_moves = []        # back_moves[slot][d] -> preallocated (slot, -d, cost) move
+        self.forward_moves = []     # forward_moves[slot][d] -> preallocated (slot, +d, cost) move
+
+        occupancy = self.wall_mask
+        positions = 0
+        self.red_slot = None
+
+        for slot, (vehicle, position) in enumerate(zip(self.table, gameboard.positions)):
+            lane = int(vehicle.lane)
+            position = int(position)
+
+            # Horizontal vehicles slide along their row, vertical ones along their column
+            if vehicle.orientation == 'H':
+                lane_count, lane_size = self.height, self.width
+                base, stride = lane * self.width, 1
+            else:
+                lane_count, lane_size = self.width, self.height
+                base, stride = lane, self.width
+
+            limit = lane_size - vehicle.length
+            if not 0 <= lane < lane_count or not 0 <= position <= limit:
+                raise ValueError(f"Vehicle {vehicle.id} is outside the {self.width}x{self.height} board")
+
+            # Precompute the cells touched by every position of this vehicle
+            cells = [1 << (base + p * stride) for p in range(lane_size)]
+            masks, back, forward, back_toggle, forward_toggle = [], [], [], [], []
+            for p in range(limit + 1):
+                masks.append(sum(cells[p:p + vehicle.length]))
+                back.append(cells[p - 1] if p > 0 else 0)
+                forward.append(cells[p + vehicle.length] if p < limit else 0)
+                back_toggle.append((cells[p - 1] | cells[p + vehicle.length - 1]) if p > 0 else 0)
+                forward_toggle.append((cells[p] | cells[p + vehicle.length]) if p < limit else 0)
+
+                # Remember which slots can occupy each cell (used to look up occupants)
+                for i in range(vehicle.length):
+                    index = base + (p + i) * stride
+                    if slot not in self.cell_candidates[index]:
+                        self.cell_candidates[index].append(slot)
+
+            shift = self.cell_count + slot * self.position_bits
+            costs = [self.move_cost(vehicle, d) for d in range(lane_size)]
+            self.back_moves.append([(slot, -d, costs[d]) for d in range(lane_size)])
+            self.forward_moves.append([(slot, d, costs[d]) for d in range(lane_size)])
+            self.shifts.append(shift)
+            self.units.append(1 << shift)
+            self.limits.append(limit)
+            self.cell_masks.append(masks)
+            self.back_cells.append(back)
+            self.forward_cells.append(forward)
+            self.back_toggles.append(back_toggle)
+            self.forward_toggles.append(forward_toggle)
+
+            # Vehicles may never share a cell, with each other or with a wall
+            if occupancy & masks[position]:
+                raise ValueError(f"Vehicle {vehicle.id} overlaps another vehicle or a wall")
+            occupancy |= masks[position]
+            positions |= position << shift
+
+            if vehicle.id == '#':
+                self.red_slot = slot
+
+        if self.red_slot is None:
+            raise ValueError("The gameboard has no red car '#'")
+
+        # The tables of every slot gathered in one tuple, so move generation unpacks
+        # them once per slot instead of indexing a list per table (this matters most on
+        # large boards, where states are wide integers and vehicles are many)
+        self.slot_tables = list(zip(range(len(self.table)), self.shifts, self.units, self.limits,
+                                    self.back_cells, self.back_toggles, self.back_moves,
+                                    self.forward_cells, self.forward_toggles, self.forward_moves))
+
+        # The red car wins when its front reaches the right edge on the exit row
+        red_vehicle = self.table[self.red_slot]
+        red_shift = self.shifts[self.red_slot]
+        self.exit_row = math.ceil(self.height / 2) - 1
+        self.red_field = self.position_mask << red_shift
+        if red_vehicle.orientation == 'H' and red_vehicle.lane == self.exit_row:
+            self.goal_bits = (self.width - red_vehicle.length) << red_shift
+        else:
+            self.goal_bits = None
+
+        # Cheapest cost of taking every slot out of the exit row from each of its positions
+        self.clear_costs = [self.clear_cost_table(slot) for slot in range(len(self.table))]
+
+        self.initial_state = positions | occupancy
+        self.gameboards = {}        # Interning table: state -> its decoded Gameboard
+
+    # Enumerate every goal state: the red car at the exit and every other vehicle
+    # anywhere along its lane without overlapping. Vehicles sharing a lane can never
+    # pass each other, so they keep their initial order. With a `limit`, the
+    # enumeration gives up (returning None) once more than `limit` goals are found.
+    def goal_states(self, limit=None):
+        if self.goal_bits is None:
+            return []
+
+        initial_positions = self.positions(self.initial_state)
+
+        # Link every vehicle to its neighbours in the same lane (initial order)
+        lanes = {}
+        for slot in sorted(range(len(self.table)), key=lambda s: initial_positions[s]):
+            vehicle = self.table[slot]
+            lanes.setdefault((vehicle.orientation, vehicle.lane), []).append(slot)
+
+        previous_slot = [None] * len(self.table)
+        next_slot = [None] * len(self.table)
+        for lane_slots in lanes.values():
+            for before, after in zip(lane_slots, lane_slots[1:]):
+                previous_slot[after] = before
+                next_slot[before] = after
+
+        # Place the red car first, then every lane from left/top to right/bottom
+        order = [self.red_slot] + [slot for lane_slots in lanes.values() for slot in lane_slots if slot != self.red_slot]
+        placed = [None] * len(self.table)
+        goal_position = self.goal_bits >> self.shifts[self.red_slot]
+        goals = []
+
+        def place(index, state):
+            if limit is not None and len(goals) > limit:
+                return
+            if index == len(order):
+                goals.append(state)
+                return
+
+            slot = order[index]
+            length = self.table[slot].length
+            low, high = 0, self.limits[slot]
+            if slot == self.red_slot:
+                low = high = goal_position
+
+            # Stay behind the next vehicle and ahead of the previous one in the lane
+            before, after = previous_slot[slot], next_slot[slot]
+            if before is not None and placed[before] is not None:
+                low = max(low, placed[before] + self.table[before].length)
+            if after is not None and placed[after] is not None:
+                high = min(high, placed[after] - length)
+
+            for position in range(low, high + 1):
+                mask = self.cell_masks[slot][position]
+                if not state & mask:
+                    placed[slot] = position
+                    place(index + 1, state | mask | (position << self.shifts[slot]))
+            placed[slot] = None
+
+        place(0, self.wall_mask)
+        return goals if limit is None or len(goals) <= limit else None
+
+    # Key identifying the level's static data (board size, walls, vehicle table and
+    # models), used to name tables precomputed for the level
+    def signature(self):
+        # Imported here: only the precomputed tables need a signature
+        import json
+        import hashlib
+
+        table = [(v.id, v.orientation, v.length, v.lane) for v in self.table]
+        description = [self.width, self.height, table, self.action_model, self.cost_model]
+        if self.walls:
+            description.append(self.walls)
+        description = json.dumps(description)
+        return hashlib.sha1(description.encode()).hexdigest()
+
+    # Cost of moving a vehicle by a number of cells under the cost model
+    def move_cost(self, vehicle, distance):
+        if self.cost_model == "unit":
+            return 1
+        return vehicle.length * distance
+
+    # Cheapest cost of moving a vehicle by a number of cells, in one or more moves
+    # (step moves cost one cell each; a slide covers the distance at once)
+    def displacement_cost(self, vehicle, distance):
+        if distance == 0:
+            return 0
+        if self.slide:
+            return self.move_cost(vehicle, distance)
+        return distance * self.move_cost(vehicle, 1)
+
+    # Cheapest cost of taking a slot out of the exit row, for every position of the slot.
+    # A vertical vehicle covering the exit row must reach the nearest position above or
+    # below it that its lane allows (walls cannot be crossed); a horizontal one never
+    # leaves its row, so a single move is all that can be said.
+    def clear_cost_table(self, slot):
+        vehicle = self.table[slot]
+        limit = self.limits[slot]
+        free = [not self.cell_masks[slot][p] & self.wall_mask for p in range(limit + 1)]
+        costs = []
+
+        for position in range(limit + 1):
+            if vehicle.orientation == 'H':
+                costs.append(self.displacement_cost(vehicle, 1))
+                continue
+
+            # Positions reachable along the lane from this one
+            low = high = position
+            while low > 0 and free[low - 1]:
+                low -= 1
+            while high < limit and free[high + 1]:
+                high += 1
+
+            clear = [abs(p - position) for p in range(low, high + 1)
+                     if p > self.exit_row or p + vehicle.length - 1 < self.exit_row]
+            costs.append(self.displacement_cost(vehicle, min(clear, default=1)))
+
+        return costs
+
+    # Read the lane position of a vehicle slot in a state
+    def position(self, state, slot):
+        return (state >> self.shifts[slot]) & self.position_mask
+
+    # Check if the red car has reached the exit
+    def is_solved(self, state):
+        return (state & self.red_field) == self.goal_bits
+
+    # Generate all states reachable with one move of the action model
+    # (same rules as moves(), unrolled into one list for breadth-first engines)
+    def successors(self, state):
+        occupancy = state & self.board_mask
+        position_mask, slide = self.position_mask, self.slide
+        next_states = []
+
+        for _, shift, unit, limit, back_cells, back_toggles, _, forward_cells, forward_toggles, _ in self.slot_tables:
+            position = (state >> shift) & position_mask
+
+            # Move left / up (one cell at a time while sliding)
+            next_state, p = state, position
+            while p > 0 and not occupancy & back_cells[p]:
+                next_state = (next_state ^ back_toggles[p]) - unit
+                next_states.append(next_state)
+                if not slide:
+                    break
+                p -= 1
+
+            # Move right / down (one cell at a time while sliding)
+            next_state, p = state, position
+            while p < limit and not occupancy & forward_cells[p]:
+                next_state = (next_state ^ forward_toggles[p]) + unit
+                next_states.append(next_state)
+                if not slide:
+                    break
+                p += 1
+
+        return next_states
+
+    # Generate all (next state, move cost) pairs reachable with one move
+    # (successors() with costs, for engines that need both but not the moves)
+    def weighted_successors(self, state):
+        occupancy = state & self.board_mask
+        position_mask, slide = self.position_mask, self.slide
+        next_states = []
+
+        for (_, shift, unit, limit, back_cells, back_toggles, back_moves,
+             forward_cells, forward_toggles, forward_moves) in self.slot_tables:
+            position = (state >> shift) & position_mask
+
+            # Move left / up (one cell at a time while sliding)
+            next_state, p = state, position
+            while p > 0 and not occupancy & back_cells[p]:
+                next_state = (next_state ^ back_toggles[p]) - unit
+                next_states.append((next_state, back_moves[position - p + 1][2]))
+                if not slide:
+                    break
+                p -= 1
+
+            # Move right / down (one cell at a time while sliding)
+            next_state, p = state, position
+            while p < limit and not occupancy & forward_cells[p]:
+                next_state = (next_state ^ forward_toggles[p]) + unit
+                next_states.append((next_state, forward_moves[p - position + 1][2]))
+                if not slide:
+                    break
+                p += 1
+
+        return next_states
+
+    # Lazily generate the legal moves of a state as (slot, delta, cost) tuples,
+    # where delta is the signed number of cells and cost the price of the move
+    def moves(self, state):
+        occupancy = state & self.board_mask
+        position_mask, slide = self.position_mask, self.slide
+
+        for _, shift, _, limit, back_cells, _, back_moves, forward_cells, _, forward_moves in self.slot_tables:
+            position = (state >> shift) & position_mask
+
+            # Move left / up (every free distance while sliding)
+            p = position
+            while p > 0 and not occupancy & back_cells[p]:
+                yield back_moves[position - p + 1]
+                if not slide:
+                    break
+                p -= 1
+
+            # Move right / down (every free distance while sliding)
+            p = position
+            while p < limit and not occupancy & forward_cells[p]:
+                yield forward_moves[p - position + 1]
+                if not slide:
+                    break
+                p += 1
+
+    # Make a move: return the state reached by applying it
+    def apply(self, state, move):
+        slot, delta, _ = move
+        masks = self.cell_masks[slot]
+        position = (state >> self.shifts[slot]) & self.position_mask
+
+        return (state ^ masks[position] ^ masks[position + delta]) + delta * self.units[slot]
+
+    # Recover the move leading from a state to one of its successors
+    def move_between(self, state, next_state):
+        for slot, shift in enumerate(self.shifts):
+            delta = ((next_state >> shift) & self.position_mask) - ((state >> shift) & self.position_mask)
+            if delta > 0:
+                return self.forward_moves[slot][delta]
+            if delta < 0:
+                return self.back_moves[slot][-delta]
+
+        return None
+
+    # Unmake a move: return the state the move was applied to
+    def undo(self, state, move):
+        slot, delta, cost = move
+        return self.apply(state, (slot, -delta, cost))
+
+    # Find the slot of the vehicle covering a cell index, or None if the cell is empty
+    def occupant(self, state, index):
+        bit = 1 << index
+        if not state & bit:
+            return None
+
+        for slot in self.cell_candidates[index]:
+            if self.cell_masks[slot][(state >> self.shifts[slot]) & self.position_mask] & bit:
+                return slot
+
+        return None
+
+    # Admissible heuristic for every action and cost model: the red car must still
+    # cover its distance to the exit, and every vehicle in front of it on the exit row
+    # must be moved out of the way, which costs at least its clear cost. These are
+    # moves of different vehicles, so the costs add up and never exceed the real one.
+    def blocker_bound(self, state):
+        if self.goal_bits is None:
+            return 0
+
+        red_vehicle = self.table[self.red_slot]
+        front = self.position(state, self.red_slot) + red_vehicle.length
+        bound = self.displacement_cost(red_vehicle, self.width - front)
+
+        # Vehicles on the exit row ahead of the red car
+        row_base = self.exit_row * self.width
+        blockers = set()
+        for col in range(front, self.width):
+            slot = self.occupant(state, row_base + col)
+            if slot is not None and slot not in blockers:
+                blockers.add(slot)
+                bound += self.clear_costs[slot][self.position(state, slot)]
+
+        return bound
+
+    # Bitboard version of helpFunctions.heuristic_blocking_chain (not admissible: vehicles
+    # further down the chain may never have to move, and under unit cost one move
+    # can cover several cells)
+    def blocking_chain(self, state):
+        red_vehicle = self.table[self.red_slot]
+        y_position = red_vehicle.lane
+        x_position = self.position(state, self.red_slot) + red_vehicle.length - 1
+
+        to_check = []
+        blocking_slots = set()
+
+        # Scan all cells to the right of the red car
+        for col in range(x_position + 1, self.width):
+            slot = self.occupant(state, y_position * self.width + col)
+            if slot is not None and slot not in blocking_slots:
+                blocking_slots.add(slot)
+                to_check.append(slot)
+
+        # Follow the chain of vehicles blocking the blockers
+        while to_check:
+            slot = to_check.pop()
+            vehicle = self.table[slot]
+            position = self.position(state, slot)
+
+            if vehicle.orientation == 'H':
+                lane_size, base, stride = self.width, vehicle.lane * self.width, 1
+            else:
+                lane_size, base, stride = self.height, vehicle.lane, self.width
+
+            for neighbor_position in (position - 1, position + vehicle.length):
+                if 0 <= neighbor_position < lane_size:
+                    neighbor = self.occupant(state, base + neighbor_position * stride)
+                    if neighbor is not None and neighbor not in blocking_slots:
+                        blocking_slots.add(neighbor)
+                        to_check.append(neighbor)
+
+        return len(blocking_slots)
+
+    # Encode a Gameboard holding the same vehicles as an integer state
+    def encode(self, gameboard: Gameboard):
+        positions = {info.id: int(p) for info, p in zip(gameboard.table, gameboard.positions)}
+        state = self.wall_mask
+
+        for slot, vehicle in enumerate(self.table):
+            position = positions[vehicle.id]
+            state |= self.cell_masks[slot][position] | (position << self.shifts[slot])
+
+        return state
+
+    # Decode the lane positions of an integer state, indexed by slot
+    def positions(self, state):
+        return tuple((state >> shift) & self.position_mask for shift in self.shifts)
+
+    # Decode an integer state back into a Gameboard object sharing the static table
+    # (every state is decoded once; later requests return the same interned object)
+    def to_gameboard(self, state):
+        gameboard = self.gameboards.get(state)
+        if gameboard is None:
+            gameboard = Gameboard.from_positions(self.width, self.height, self.table, self.positions(state),
+                                                 walls=self.walls)
+            self.gameboards[state] = gameboard
+
+        return gameboard
+
+    # Rebuild the list of Gameboards reached by playing a sequence of moves from a state
+    def replay(self, state, moves):
+        states = [state]
+        for move in moves:
+            state = self.apply(state, move)
+            states.append(state)
+
+        return [self.to_gameboard(s) for s in states]
+
+    # Rebuild the path of a bidirectional search: forward parent links lead from the
+    # meeting state back to the initial state, backward ones lead on to a goal state
+    def join_paths(self, forward_parents, backward_parents, meeting_state):
+        path = self.trace_path(forward_parents, meeting_state)
+
+        state = backward_parents[meeting_state]
+        while state is not None:
+            path.append(self.to_gameboard(state))
+            state = backward_parents[state]
+
+        return path
+
+    # Rebuild the list of Gameboards from the initial state to a state using parent links
+    def trace_path(self, parents, state):
+        states = []
+        while state is not None:
+            states.append(state)
+            state = parents[state]
+
+        states.reverse()
+        return [self.to_gameboard(s) for s in states]
@@ -3,12 +3,20 @@ from Code import config
 from Code.gameboard import Gameboard        
 from Code.vehicleSprite import VehicleSprite  
 
+# Number of rows/columns of the grid drawn on the board image
+IMAGE_GRID_SIZE = 6
+
+# Color of the wall cells
+WALL_COLOR = (60, 60, 60)
+
 # BoardRenderer handles rendering the game board and vehicles on screen
 class BoardRenderer:
-    def __init__(self, gameboard: Gameboard, board_image_path, cell_size = 62, grid_size = 6, offset_x = 275, offset_y = 172):
+    def __init__(self, gameboard: Gameboard, board_image_path, cell_size = 62, grid_size = None, offset_x = 275, offset_y = 172):
         self.gameboard = gameboard      # The game logic board
-        self.cell_size = cell_size      # Size of each grid cell in pixels
-        self.grid_size = grid_size      # Number of rows/columns (default is 6 for Rush Hour)
+        self.grid_size = grid_size or max(gameboard.width, gameboard.height)  # Number of rows/columns of the level
+
+        # Larger boards shrink their cells to fit in the grid of the board image
+        self.cell_size = cell_size * IMAGE_GRID_SIZE // max(self.grid_size, IMAGE_GRID_SIZE)  # Size of each grid cell in pixels
 
         # Load and scale the board background image to match the screen size
         self.board_image = pygame.image.load(board_image_path).convert()
@@ -30,6 +38,9 @@ class BoardRenderer:
     # Draw the board and all vehicle sprites on the screen
     def draw(self, screen):
         screen.blit(self.board_image, (0, 0))  # Draw the game board background at (0,0)
+        for x, y in self.gameboard.walls:
+            wall = pygame.Rect(x * self.cell_size + self.offset_x, y * self.cell_size + self.offset_y, self.cell_size, self.cell_size)
+            pygame.draw.rect(screen, WALL_COLOR, wall)  # Draw each wall cell
         for sprite in self.vehicle_sprites:
             sprite.draw(screen, self.cell_size, self.offset_x, self.offset_y)  # Draw each vehicle sprite
 
@@ -4,9 +4,10 @@ import pygame
 class Button:
 
     # Constructor of Button class
-    def __init__(self, x, y, w, h, text = "", callback = None, font = None, icon_path = None):
+    def __init__(self, x, y, w, h, text = "", callback = None, font = None, icon_path = None, bg_color = None):
         self.rect = pygame.Rect(x, y, w, h)
         self.text = text                  # Optional text label
+        self.bg_color = bg_color          # Optional background color behind the text label
         self.callback = callback          # Function to call when clicked
         self.font = font                  # Font for text rendering
         self.base_icon = None             # Original icon image
@@ -33,6 +34,13 @@ class Button:
             screen.blit(self.scaled_icon, icon_rect)
 
         elif self.text and self.font:
+            # Fill the background (grown when hovered) behind the text label
+            if self.bg_color:
+                scale = 1.2 if self.hovered else 1.0
+                bg_rect = pygame.Rect(0, 0, int(self.rect.width * scale), int(self.rect.height * scale))
+                bg_rect.center = self.rect.center
+                pygame.draw.rect(screen, self.bg_color, bg_rect)
+
             # Render text if no icon is provided
             txt_surf = self.font.render(self.text, True, "#000000")
             txt_rect = txt_surf.get_rect(center = self.rect.center)
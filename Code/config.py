@@ -1,4 +1,4 @@
-# Declare gameboard size
+# Declare gameboard size (of levels that do not declare their own)
 GAMEBOARD_WIDTH = 6
 GAMEBOARD_HEIGHT = 6
 
@@ -6,5 +6,55 @@ GAMEBOARD_HEIGHT = 6
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 650
 
-# Declare max limit for DLS algorithm
-MAX_LIMIT = 100000
\ No newline at end of file
+# Declare max depth limit for DLS / iterative deepening DFS
+MAX_LIMIT = 100000
+# Declare default action model for search algorithms:
+#   "step"  - a move shifts one vehicle by exactly one cell
+#   "slide" - a move slides one vehicle by any number of free cells
+ACTION_MODEL = "step"
+
+# Declare default cost model for search algorithms:
+#   "length" - a move costs the vehicle length times the number of cells moved
+#   "unit"   - every move costs 1
+COST_MODEL = "length"
+
+# Declare number of slots in the transposition table of depth-first solvers
+TRANSPOSITION_TABLE_SIZE = 1 << 20
+
+# Declare default heuristic of informed search algorithms:
+#   "blockers"         - cost of moving the red car and the vehicles in front of it to the exit
+#   "blocking_chain"   - number of vehicles in the red car's blocking chain (not admissible:
+#                        A*, IDA* and ARA* may then return solutions that are not optimal)
+#   "pattern_database" - exact costs of abstractions keeping the red car and its blockers
+HEURISTIC = "blockers"
+
+# Declare number of heuristic values memoized by informed search algorithms (LRU)
+HEURISTIC_CACHE_SIZE = 100000
+
+# Declare largest number of blockers kept in one pattern database (besides the red car)
+PDB_PATTERN_SIZE = 4
+
+# Declare directory where pattern databases are saved and reused (None disables it)
+PDB_CACHE_DIR = None
+
+# Declare directory where retrograde distance tables are saved and reused (None disables it)
+RETROGRADE_CACHE_DIR = None
+
+# Declare sqlite file caching the solutions found by the GUI (None disables it)
+SOLUTION_CACHE_FILE = "Cache/solutions.db"
+
+# Declare time budget (seconds) of the anytime weighted A* algorithm
+ANYTIME_TIME_LIMIT = 1.0
+
+# Declare first heuristic weight of the anytime weighted A* algorithm, and the share
+# of (weight - 1) kept after every pass (the weight falls to 1, where solutions are optimal)
+ANYTIME_INITIAL_WEIGHT = 20.0
+ANYTIME_WEIGHT_DECAY = 0.5
+
+# Declare number of expanded nodes between two progress snapshots of a search session
+PROGRESS_INTERVAL = 1000
+
+# Declare how searches measure themselves:
+#   "fast"     - perf_counter time and a cheap peak memory estimate (RSS growth, table sizes)
+#   "detailed" - perf_counter time and the exact peak of Python allocations (tracemalloc, much slower)
+METRICS_MODE = "fast"
@@ -2,7 +2,9 @@ from Code import button
 from Code import algorithmControl
 from Code import gameStates
 from Code import renderFunctions
-from Code.searchAlgorithms import bfs_algorithm, dls_algorithm, A_star_algorithm, ucs_algorithm
+from Code.searchAlgorithms import bfs_algorithm, iddfs_algorithm, A_star_algorithm, ucs_algorithm
+from Code.searchAlgorithms import bidirectional_bfs_algorithm, bidirectional_ucs_algorithm, ida_star_algorithm
+from Code.searchAlgorithms import retrograde_algorithm, anytime_A_star_algorithm
 
 # Create control buttons
 def create_control_buttons(states, SCREEN, FONT, DETAIL_TITLE_FONT, DETAIL_FONT):
@@ -52,6 +54,12 @@ def create_control_buttons(states, SCREEN, FONT, DETAIL_TITLE_FONT, DETAIL_FONT)
             FONT, "Images/Buttons/viewstep.png"
         ),  # Toggle between overview and step-by-step mode
 
+        "cancel_search_button": button.Button(
+            340, 400, 120, 45, "CANCEL",
+            lambda: algorithmControl.cancel_search(states),
+            FONT, bg_color = "#ff914d"
+        ),  # Stop the running search
+
         # Information display
         "information_button": button.Button(
             20, 20, 50, 50, "",
@@ -65,28 +73,36 @@ def create_control_buttons(states, SCREEN, FONT, DETAIL_TITLE_FONT, DETAIL_FONT)
 # Create buttons to select algorithms
 def create_algorithm_buttons(state, SCREEN, FONT):
     algorithm_buttons = []
-    algorithms = ["BFS", "DLS", "UCS", "A STAR"]  # List of supported algorithms
-    start_x, start_y = 210, 330  # Starting position for button grid
-    width, height, gap = 80, 60, 100  # Button size and spacing
+    algorithms = ["BFS", "DLS", "UCS", "A STAR", "BI-BFS", "BI-UCS", "IDA*", "RETRO", "ARA*"]  # List of supported algorithms
+    icon_algorithms = ["BFS", "DLS", "UCS", "A STAR"]  # Algorithms with an icon image (others show a text label)
+    start_x, start_y = 209, 322  # Starting position for button grid
+    width, height, gap_x, gap_y, columns = 63, 45, 80, 50, 5  # Button size and grid layout
 
     for i, name in enumerate(algorithms):
-        x = start_x + i * gap
-        y = start_y
+        x = start_x + (i % columns) * gap_x  # Calculate X based on column
+        y = start_y + (i // columns) * gap_y  # Calculate Y based on row
 
         # Create callback function for algorithm selection
         def make_callback(algo_name):
             def callback():
                 func_map = {
-                    "BFS": bfs_algorithm, "DLS": dls_algorithm,
-                    "A STAR": A_star_algorithm, "UCS": ucs_algorithm
+                    "BFS": bfs_algorithm, "DLS": iddfs_algorithm,
+                    "A STAR": A_star_algorithm, "UCS": ucs_algorithm,
+                    "BI-BFS": bidirectional_bfs_algorithm, "BI-UCS": bidirectional_ucs_algorithm,
+                    "IDA*": ida_star_algorithm, "RETRO": retrograde_algorithm,
+                    "ARA*": anytime_A_star_algorithm
                 }
                 # Call algorithm handler with selected function
-                algorithmControl.select_algorithm_callback(state, func_map[algo_name], SCREEN, FONT)
+                algorithmControl.select_algorithm_callback(state, func_map[algo_name])
             return callback
 
-        # Create button with icon and corresponding callback
-        btn = button.Button(x, y, width, height, "", callback = make_callback(name),
-                            font = FONT, icon_path = f"Images/Algorithms/{name}.png")
+        # Create button with icon (or text label) and corresponding callback
+        if name in icon_algorithms:
+            btn = button.Button(x, y, width, height, "", callback = make_callback(name),
+                                font = FONT, icon_path = f"Images/Algorithms/{name}.png")
+        else:
+            btn = button.Button(x, y, width, height, name, callback = make_callback(name),
+                                font = FONT, bg_color = "#ff914d")
         algorithm_buttons.append(btn)
 
     return algorithm_buttons
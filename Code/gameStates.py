@@ -18,6 +18,8 @@ def create_game_state():
         "selected_level": 0,               # Currently selected level (0 means not selected)
         "selected_algorithm": None,        # Name of the selected algorithm
         "current_solver": None,            # Reference to the algorithm function being used
+        "solver_thread": None,             # Background thread running the search (None when idle)
+        "cancelled_thread": None,          # Cancelled search thread that may still be winding down
 
         # Board and animation rendering
         "board_renderer": None,            # Object that draws the game board
@@ -35,10 +37,13 @@ def create_game_state():
         "expanded_nodes": 0,               # Total number of nodes expanded during solving
         "total_moves": None,               # Total number of moves in the solution
         "total_cost": None,                # Total cost of the solution (if applicable)
+        "metrics_mode": None,              # How time and memory were measured ("fast" or "detailed")
+        "cached_result": False,            # Whether the result came from the solution cache
 
         # No solution state
         "no_solution_flag": False,         # Whether the algorithm failed to find a solution
-        "no_solution_time": 0              # Timestamp when the "NO SOLUTION" state was triggered
+        "no_solution_time": 0,             # Timestamp when the "NO SOLUTION" state was triggered
+        "search_failed": False             # Whether the search raised an error instead of finishing
     }
 
     return states
@@ -132,6 +137,11 @@ def handle_events(event, state, buttons, level_buttons, algorithm_buttons):
     if event.type == pygame.QUIT:
         return False
 
+    # While a search runs, only its cancel button reacts
+    if state["solver_thread"]:
+        buttons["cancel_search_button"].handle_event(event)
+        return True
+
     # Handle click to start from welcome screen
     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
         if not state["state_game_flag"]:
@@ -1,114 +1,116 @@
 import math
-from Code.vehicle import Vehicle
+from Code.vehicle import VehicleInfo
+
+# Character marking a wall cell in the board grid
+WALL = '*'
 
 class Gameboard():
+    __slots__ = ('width', 'height', 'walls', 'table', 'positions', '_vehicles', '_board', '_hash')
 
     # Constructor of Gameboard class
-    def __init__(self, width, height, vehicles):
+    def __init__(self, width, height, vehicles, walls=()):
         self.width = width                # Width of the game board
         self.height = height              # Height of the game board
-
-        # Fill the board grid with empty cells represented by '.'
-        self.board = [["." for x in range(self.width)] for y in range(self.height)]
-        self.vehicles = vehicles          # List of Vehicle objects
-
-        # Place vehicles on the board
-        for vehicle in self.vehicles:
-            # Place horizontal vehicle
-            if vehicle.orientation == 'H':
-                for i in range(vehicle.length):
-                    self.board[int(vehicle.y)][int(vehicle.x + i)] = vehicle.id
-            # Place vertical vehicle
-            if vehicle.orientation == 'V':
-                for i in range(vehicle.length):
-                    self.board[int(vehicle.y + i)][int(vehicle.x)] = vehicle.id
-
-        # Sort vehicles in matrix order (top to bottom, left to right)
-        self.vehicles = sorted(vehicles, key=lambda v: (v.y, v.x))
+        self.walls = tuple(sorted((int(x), int(y)) for x, y in walls))  # (x, y) cells no vehicle may enter
+
+        # Sort vehicles in matrix order (top to bottom, left to right) once per level
+        vehicles = sorted(vehicles, key=lambda v: (v.y, v.x))
+
+        # Split vehicles into the static table and the per-state positions
+        self.table = tuple(VehicleInfo.from_vehicle(v, width, height) for v in vehicles)
+        self.positions = tuple(info.position_of(v) for info, v in zip(self.table, vehicles))
+
+        self._vehicles = vehicles         # List of Vehicle objects (built lazily for derived states)
+        self._board = None                # Grid of vehicle IDs (built lazily)
+        self._hash = None                 # Zobrist hash (computed lazily)
+
+    # Create a gameboard sharing a static vehicle table, storing only positions
+    @classmethod
+    def from_positions(cls, width, height, table, positions, walls=()):
+        gameboard = cls.__new__(cls)
+        gameboard.width = width
+        gameboard.height = height
+        gameboard.walls = walls
+        gameboard.table = table
+        gameboard.positions = positions
+        gameboard._vehicles = None
+        gameboard._board = None
+        gameboard._hash = None
+        return gameboard
+
+    # List of Vehicle objects in slot order
+    @property
+    def vehicles(self):
+        if self._vehicles is None:
+            self._vehicles = [info.to_vehicle(p) for info, p in zip(self.table, self.positions)]
+        return self._vehicles
+
+    # Grid of vehicle IDs where empty cells are represented by '.'
+    @property
+    def board(self):
+        if self._board is None:
+            # Fill the board grid with empty cells represented by '.'
+            self._board = [["." for x in range(self.width)] for y in range(self.height)]
+
+            # Mark the walls, which block vehicles like an occupied cell
+            for x_position, y_position in self.walls:
+                self._board[y_position][x_position] = WALL
+
+            # Place vehicles on the board
+            for info, position in zip(self.table, self.positions):
+                x_position, y_position = info.coordinates(position)
+                # Place horizontal vehicle
+                if info.orientation == 'H':
+                    for i in range(info.length):
+                        self._board[int(y_position)][int(x_position + i)] = info.id
+                # Place vertical vehicle
+                if info.orientation == 'V':
+                    for i in range(info.length):
+                        self._board[int(y_position + i)][int(x_position)] = info.id
+
+        return self._board
 
     # Represents the gameboard object as a string
     def __repr__(self):
         # Format the board for printing with spacing
-        self.printableboard = '\n\n'.join(['      '.join(['{}'.format(item) for item in row]) for row in self.board])
-        return self.printableboard
+        return '\n\n'.join(['      '.join(['{}'.format(item) for item in row]) for row in self.board])
 
-    # Hash the gameboard using its string representation
+    # Hash the gameboard by XOR-ing the Zobrist keys of every (vehicle, position) pair
     def __hash__(self):
-        return hash(self.__repr__())
+        if self._hash is None:
+            hash_value = 0
+            for info, position in zip(self.table, self.positions):
+                hash_value ^= info.zobrist[int(position)]
+            self._hash = hash_value
+
+        return self._hash
 
     # Compare two gameboard objects based on vehicle positions and IDs
     def __eq__(self, other):
-        for v in self.vehicles:
-            if v not in other.vehicles: 
-                return False
-        return True
-
-    # Generate all possible board states from valid vehicle movements
-    def check_for_moves(self):
-        # Initialize list to hold all valid next board states
-        possibleBoards = []
-
-        # Iterate through each vehicle
-        for vehicle in self.vehicles:
-            x_position = int(vehicle.x)
-            y_position = int(vehicle.y)
-
-            # Horizontal movement checks
-            if vehicle.orientation == 'H':
-                # Move left
-                if x_position != 0:
-                    if self.board[y_position][x_position - 1] == '.':
-                        newVehicles = self.vehicles.copy()
-                        newVehicle = Vehicle(vehicle.id, x_position - 1, y_position, vehicle.orientation, vehicle.length)
-                        newVehicles.remove(vehicle)
-                        newVehicles.append(newVehicle)
-                        possibleBoards.append(newVehicles)
-
-                # Move right
-                if (x_position + vehicle.length - 1) != self.width - 1:
-                    if self.board[y_position][x_position + vehicle.length] == '.':
-                        newVehicles = self.vehicles.copy()
-                        newVehicle = Vehicle(vehicle.id, x_position + 1, y_position, vehicle.orientation, vehicle.length)
-                        newVehicles.remove(vehicle)
-                        newVehicles.append(newVehicle)
-                        possibleBoards.append(newVehicles)
-
-            # Vertical movement checks
-            if vehicle.orientation == 'V':
-                # Move up
-                if y_position != 0:
-                    if self.board[y_position - 1][x_position] == '.':
-                        newVehicles = self.vehicles.copy()
-                        newVehicle = Vehicle(vehicle.id, x_position, y_position - 1, vehicle.orientation, vehicle.length)
-                        newVehicles.remove(vehicle)
-                        newVehicles.append(newVehicle)
-                        possibleBoards.append(newVehicles)
-
-                # Move down
-                if y_position + (vehicle.length - 1) != self.height - 1:
-                    if self.board[y_position + vehicle.length][x_position] == '.':
-                        newVehicles = self.vehicles.copy()
-                        newVehicle = Vehicle(vehicle.id, x_position, y_position + 1, vehicle.orientation, vehicle.length)
-                        newVehicles.remove(vehicle)
-                        newVehicles.append(newVehicle)
-                        possibleBoards.append(newVehicles)
-
-        # Return all generated next states
-        return possibleBoards
-
-    # Return the solution path from a given state (used for debugging or placeholder)
-    def get_solution_path(self, state):
-        return state
+        if not isinstance(other, Gameboard):
+            return NotImplemented
+
+        # States of the same level share their table, so comparing keys is enough
+        if self.table is other.table:
+            return self.positions == other.positions
+
+        # Boards built from separate tables: compare their walls and vehicles in ID order
+        return self.walls == other.walls and self.canonical_vehicles() == other.canonical_vehicles()
+
+    # Vehicle data (ID, orientation, length, x, y) sorted by ID, independent of slot order
+    # (the same fields as the Zobrist keys, so equal boards always hash equally)
+    def canonical_vehicles(self):
+        return sorted((info.id, info.orientation, info.length) + info.coordinates(position)
+                      for info, position in zip(self.table, self.positions))
 
     # Check if the red car (usually represented by '#') has reached the exit
     def has_solved(self):
-        for vehicle in self.vehicles:
-            # Define the target exit position for red car
-            winning_x = self.width - 2
-            winning_y = math.ceil(self.height / 2) - 1
+        # Define the target exit row for red car (its front must reach the right edge)
+        winning_y = math.ceil(self.height / 2) - 1
 
+        for info, position in zip(self.table, self.positions):
             # Check if red car is in the correct position and orientation
-            if vehicle.id == '#' and vehicle.x == winning_x and vehicle.y == winning_y and vehicle.orientation == "H":
+            if info.id == '#' and info.orientation == "H" and position == self.width - info.length and info.lane == winning_y:
                 return True
 
         return False
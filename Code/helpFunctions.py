@@ -2,26 +2,48 @@ import json
 from collections import deque
 from Code import config
 from Code.vehicle import Vehicle
-from Code.gameboard import Gameboard
+from Code.gameboard import Gameboard, WALL
 
-# Load gameboard from file .json
+# Load gameboard from file .json. A level is either a list of vehicles (on a board of
+# config.GAMEBOARD_WIDTH x config.GAMEBOARD_HEIGHT cells) or an object giving its own
+# "width", "height", optional "walls" ([x, y] cells) and "vehicles"
 def load_gameboard(file_path):
     # Open the JSON file and load the vehicle data
     with open(file_path, 'r') as file:
         data = json.load(file)
 
+    # Read the board size and walls of levels that declare them
+    width, height, walls = config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, []
+    if isinstance(data, dict):
+        width = data.get("width", width)
+        height = data.get("height", height)
+        walls = data.get("walls", walls)
+        data = data["vehicles"]
+
     # Create Vehicle objects from the loaded data
     vehicles = []
     for v in data:
         new_vehicle = Vehicle(id=v["id"], x=v["x"], y=v["y"], orientation=v["orientation"], length=v["length"])
         vehicles.append(new_vehicle)
 
-    # Create the gameboard with the specified width, height, and list of vehicles
-    gameboard = Gameboard(config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, vehicles)
+    # Create the gameboard with the specified width, height, walls and list of vehicles
+    gameboard = Gameboard(width, height, vehicles, walls)
 
     # Return the Gameboard object
     return gameboard
 
+# Save a list of Vehicle objects as a gameboard file .json (the format read by load_gameboard;
+# the board size and walls are only written when they differ from the default board)
+def save_gameboard(vehicles, file_path, width=None, height=None, walls=()):
+    data = [{"id": v.id, "x": v.x, "y": v.y, "orientation": v.orientation, "length": v.length} for v in vehicles]
+
+    width, height = width or config.GAMEBOARD_WIDTH, height or config.GAMEBOARD_HEIGHT
+    if (width, height) != (config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT) or walls:
+        data = {"width": width, "height": height, "walls": [list(wall) for wall in walls], "vehicles": data}
+
+    with open(file_path, 'w') as file:
+        json.dump(data, file, indent=4)
+
 # Heuristic function for A* algorithm
 def heuristic_blocking_chain(gameboard):
     """
@@ -53,8 +75,8 @@ def heuristic_blocking_chain(gameboard):
     for col in range(x_position + 1, gameboard.width):
         current_cell = gameboard.board[y_position][col]
 
-        # If we find a new vehicle (not empty and not already counted)
-        if current_cell != '.' and current_cell not in blocking_vehicles:
+        # If we find a new vehicle (not empty, not a wall and not already counted)
+        if current_cell not in ('.', WALL) and current_cell not in blocking_vehicles:
             blocking_vehicles[current_cell] = current_cell
             to_check.append(current_cell)
 
@@ -70,13 +92,13 @@ def heuristic_blocking_chain(gameboard):
 
             if left_pos >= 0:
                 neighbor = gameboard.board[blocker.y][left_pos]
-                if neighbor != '.' and neighbor not in blocking_vehicles:
+                if neighbor not in ('.', WALL) and neighbor not in blocking_vehicles:
                     to_check.append(neighbor)
                     blocking_vehicles[neighbor] = neighbor
 
-            if right_pos <= config.GAMEBOARD_WIDTH - 1:
+            if right_pos <= gameboard.width - 1:
                 neighbor = gameboard.board[blocker.y][right_pos]
-                if neighbor != '.' and neighbor not in blocking_vehicles:
+                if neighbor not in ('.', WALL) and neighbor not in blocking_vehicles:
                     to_check.append(neighbor)
                     blocking_vehicles[neighbor] = neighbor
 
@@ -87,13 +109,13 @@ def heuristic_blocking_chain(gameboard):
 
             if above_pos >= 0:
                 neighbor = gameboard.board[above_pos][blocker.x]
-                if neighbor != '.' and neighbor not in blocking_vehicles:
+                if neighbor not in ('.', WALL) and neighbor not in blocking_vehicles:
                     to_check.append(neighbor)
                     blocking_vehicles[neighbor] = neighbor
 
-            if bottom_pos <= config.GAMEBOARD_HEIGHT - 1:
+            if bottom_pos <= gameboard.height - 1:
                 neighbor = gameboard.board[bottom_pos][blocker.x]
-                if neighbor != '.' and neighbor not in blocking_vehicles:
+                if neighbor not in ('.', WALL) and neighbor not in blocking_vehicles:
                     to_check.append(neighbor)
                     blocking_vehicles[neighbor] = neighbor
 
@@ -120,3 +142,14 @@ def trace_back_solution(visited_list, initial_state, goal_state):
     result.reverse()
 
     return result
+
+# Convert a solution path (list of Gameboards sharing one vehicle table) into the
+# compact list of (slot, delta) moves between its consecutive gameboards
+def path_to_moves(path):
+    moves = []
+    for before, after in zip(path, path[1:]):
+        for slot, (old, new) in enumerate(zip(before.positions, after.positions)):
+            if old != new:
+                moves.append((slot, int(new) - int(old)))
+
+    return moves
@@ -0,0 +1,34 @@
+from collections import OrderedDict
+
+# HeuristicCache memoizes a heuristic function of integer states. It keeps at most
+# `size` values and evicts the least recently used one when it is full, so
+# duplicate-heavy searches and repeated IDA* iterations skip recomputation
+# without the cache growing with the search.
+class HeuristicCache():
+
+    # Constructor of HeuristicCache class
+    def __init__(self, heuristic, size):
+        self.heuristic = heuristic        # Function state -> heuristic value
+        self.size = size                  # Largest number of cached values
+        self.values = OrderedDict()       # State -> value, least recently used first
+        self.hits = 0                     # Evaluations answered from the cache
+        self.misses = 0                   # Evaluations that ran the heuristic
+
+    # Heuristic value of a state, computed at most once while it stays cached
+    def __call__(self, state):
+        value = self.values.get(state)
+        if value is not None:
+            self.values.move_to_end(state)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self.heuristic(state)
+        self.values[state] = value
+        if len(self.values) > self.size:
+            self.values.popitem(last=False)
+        return value
+
+    # Hit / miss counters, as reported in the search statistics
+    def stats(self):
+        return {"heuristic_cache_hits": self.hits, "heuristic_cache_misses": self.misses}
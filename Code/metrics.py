@@ -0,0 +1,134 @@
+import gc
+import os
+import sys
+import time
+from Code import config
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: the high-water mark of the RSS is unknown there
+    resource = None
+
+# glibc's malloc_trim, loaded on first use (None until then, False where it is missing)
+malloc_trim = None
+
+# What the peak memory of each mode measures, to label it in reports
+MEMORY_LABELS = {"fast": "RSS growth", "detailed": "Peak memory usage"}
+
+# Size of a memory page, to convert /proc page counts into bytes
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Largest resident set size (RSS) the process ever reached, in bytes (0 if unknown)
+def high_water_rss():
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Kilobytes except on macOS
+
+# Hand the memory freed by earlier searches back to the operating system. Imported here:
+# ctypes and libc cost milliseconds to load and only fast mode needs them.
+def release_free_memory():
+    global malloc_trim
+    if malloc_trim is None:
+        try:
+            import ctypes
+            malloc_trim = ctypes.CDLL("libc.so.6").malloc_trim
+        except (ImportError, OSError, AttributeError):  # Not glibc: freed memory may stay in the process
+            malloc_trim = False
+    if malloc_trim:
+        malloc_trim(0)
+
+# Current resident set size of the process, in bytes (the high-water mark where /proc is missing)
+def current_rss():
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return high_water_rss()
+
+# Metrics measures the running time and the peak memory of one search, in one of two modes:
+#   "fast"     - perf_counter time and a cheap memory estimate: the growth of the process
+#                RSS (sampled at start, at stop and whenever sample() is called), or the
+#                size of the search's main tables if larger. Searches run at full speed.
+#                Memory freed by earlier searches is handed back to the operating system
+#                before the start sample, so it does not hide this search's growth;
+#                still, the figure is an RSS delta, not a count of allocated bytes.
+#   "detailed" - perf_counter time and tracemalloc's exact peak of Python allocations.
+#                Every allocation is traced, so searches run several times slower.
+class Metrics():
+
+    # Constructor of Metrics class (the mode defaults to config.METRICS_MODE)
+    def __init__(self, mode=None):
+        self.mode = mode or config.METRICS_MODE
+        if self.mode not in ("fast", "detailed"):
+            raise ValueError(f"Unknown metrics mode: {self.mode}")
+
+        self.start_time = None            # perf_counter value when the measure started
+        self.start_rss = 0                # RSS when the measure started (fast mode)
+        self.start_high_water = 0         # RSS high-water mark when the measure started (fast mode)
+        self.peak_rss = 0                 # Largest RSS sampled so far (fast mode)
+        self.tracing = False              # Whether this measure started tracemalloc (detailed mode)
+
+    # Start measuring
+    def start(self):
+        if self.mode == "detailed":
+            # Imported here: tracemalloc is slow to import and only detailed mode needs it
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.tracing = True
+        else:
+            # Per-run baseline: release what earlier searches left in the allocator
+            gc.collect()
+            release_free_memory()
+            self.start_rss = self.peak_rss = current_rss()
+            self.start_high_water = high_water_rss()
+
+        self.start_time = time.perf_counter()
+        return self
+
+    # Seconds since the measure started
+    def elapsed(self):
+        return time.perf_counter() - self.start_time
+
+    # Memory used by the search so far (fast mode: RSS growth, which also takes a sample)
+    def memory(self):
+        if self.mode == "detailed":
+            import tracemalloc
+            return tracemalloc.get_traced_memory()[0]
+
+        rss = current_rss()
+        self.peak_rss = max(self.peak_rss, rss)
+        return rss - self.start_rss
+
+    # Take an RSS sample (nothing to do in detailed mode, where every allocation counts)
+    def sample(self):
+        if self.mode == "fast":
+            self.memory()
+
+    # Peak memory of the search so far. In fast mode, `tables` are the search's main
+    # containers (visited set, frontier, ...): their own size is a lower bound on its memory.
+    def peak(self, *tables):
+        if self.mode == "detailed":
+            import tracemalloc
+            return tracemalloc.get_traced_memory()[1]
+
+        self.sample()
+        growth = self.peak_rss - self.start_rss
+
+        # The high-water mark only says something if the search pushed it higher
+        high_water = high_water_rss()
+        if high_water > self.start_high_water:
+            growth = max(growth, high_water - self.start_rss)
+
+        return max(growth, sum(sys.getsizeof(table) for table in tables))
+
+    # Stop measuring: returns the elapsed seconds and the peak memory in bytes
+    def stop(self, *tables):
+        elapsed = self.elapsed()
+        peak = self.peak(*tables)
+        if self.tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            self.tracing = False
+        return elapsed, peak
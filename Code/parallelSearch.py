@@ -0,0 +1,243 @@
+import os
+import threading
+from Code.bitboard import Bitboard
+from Code.metrics import Metrics
+from Code.gameboard import Gameboard
+from Code.searchResult import SearchResult
+
+# Multiplier used to spread integer states over partitions (Fibonacci hashing)
+GOLDEN = 0x9E3779B97F4A7C15
+
+# Index of the partition owning a state. The product's middle bits depend on every
+# bit of the state, so states spread evenly whatever the partition count.
+def owner(state, partitions):
+    return ((state * GOLDEN) >> 64 & 0xFFFFFFFF) % partitions
+
+
+# BfsPartition owns the states of one hash partition during a parallel BFS: their
+# parent pointers (its share of the visited set) and its part of the current layer.
+# Duplicate detection only ever looks at the partition's own states.
+class BfsPartition():
+
+    # Constructor of BfsPartition class
+    def __init__(self, gameboard: Gameboard, action_model, cost_model, index, count):
+        self.bitboard = Bitboard(gameboard, action_model, cost_model)
+        self.index = index                # Index of this partition
+        self.count = count                # Number of partitions
+        self.parents = {}                 # State -> parent state (None for the initial state)
+        self.layer = []                   # States of the current layer owned by this partition
+
+    # Expand the current layer: return, for every partition, the (child, parent)
+    # pairs it owns (deduplicated here to keep the messages small)
+    def expand(self):
+        buckets = [{} for _ in range(self.count)]
+        parents = self.parents
+
+        for state in self.layer:
+            for next_state in self.bitboard.successors(state):
+                bucket = buckets[owner(next_state, self.count)]
+                if next_state not in bucket and next_state not in parents:
+                    bucket[next_state] = state
+
+        expanded = len(self.layer)
+        self.layer = []
+        return expanded, [list(bucket.items()) for bucket in buckets]
+
+    # Insert (child, parent) pairs sent by all partitions: new states join the next
+    # layer. Returns the number of new states and a goal state among them (or None).
+    def insert(self, pairs):
+        goal = None
+        for state, parent in pairs:
+            if state not in self.parents:
+                self.parents[state] = parent
+                self.layer.append(state)
+                if goal is None and self.bitboard.is_solved(state):
+                    goal = state
+
+        return len(self.layer), goal
+
+    # Expand the current layer and trade the buckets directly with the other partitions
+    # (peers[i] is the pipe to partition i, None for this one), then insert the pairs
+    # received. Returns the number of expanded states, the size of the next layer and
+    # a goal state in it (or None).
+    def exchange(self, peers):
+        expanded, buckets = self.expand()
+
+        # In round r, send to partition index + r while receiving from index - r, so
+        # every send meets its receive. Sending from a thread keeps two partitions
+        # with large buckets for each other from both blocking on a full pipe.
+        def send():
+            for r in range(1, self.count):
+                target = (self.index + r) % self.count
+                peers[target].send(buckets[target])
+
+        sender = threading.Thread(target=send, daemon=True)
+        sender.start()
+        pairs = buckets[self.index]
+        for r in range(1, self.count):
+            pairs += peers[(self.index - r) % self.count].recv()
+        sender.join()
+
+        size, goal = self.insert(pairs)
+        return expanded, size, goal
+
+    # Parent of a state owned by this partition
+    def parent(self, state):
+        return self.parents[state]
+
+    # Number of states owned by this partition
+    def size(self):
+        return len(self.parents)
+
+
+# Serve one partition in a worker process: run the commands sent by the coordinator.
+# `peers` holds the pipes to the other workers (None at this worker's own index).
+def partition_worker(connection, peers, gameboard, action_model, cost_model, index, count):
+    partition = BfsPartition(gameboard, action_model, cost_model, index, count)
+    while True:
+        command, payload = connection.recv()
+        if command == "stop":
+            break
+        if command == "exchange":
+            payload = (peers,)
+        connection.send(getattr(partition, command)(*payload))
+
+    connection.close()
+    for peer in peers:
+        if peer is not None:
+            peer.close()
+
+
+# Parallel BFS algorithm
+def parallel_bfs_algorithm(gameboard: Gameboard, workers=None, action_model=None, cost_model=None, stop_at_goal=True):
+    """
+    Solves the Rush Hour puzzle (or enumerates its state space) with a
+    layer-synchronous BFS spread over worker processes.
+
+    States are hash-partitioned: each worker owns the parent pointers of its
+    partition and expands its part of every layer. Generated children are sent
+    straight to the workers owning them (over a pipe between every pair of workers),
+    which drop duplicates and form the next layer; the coordinator only collects
+    the layer sizes and goal states. All workers finish a layer before the next one starts, so the first layer
+    holding a goal gives a shortest solution, rebuilt by asking the owners of the
+    states on the path for their parents.
+
+    Input:
+        gameboard (Gameboard): The starting configuration of the Rush Hour game
+        workers (int): Number of worker processes (defaults to the CPU count; 1, or
+                       being called from a daemonic process, runs in-process)
+        action_model (str): "step" or "slide" (defaults to config.ACTION_MODEL)
+        cost_model (str): "length" or "unit" (defaults to config.COST_MODEL)
+        stop_at_goal (bool): False enumerates every reachable state
+
+    Output:
+        SearchResult with the layer sizes, the states per partition and the number
+        of workers in its stats (memory is measured in the coordinating process only)
+    """
+    # Imported here: multiprocessing is slow to import and only this algorithm needs it
+    import multiprocessing
+
+    # Start measuring time and memory
+    metrics = Metrics().start()
+
+    bitboard = Bitboard(gameboard, action_model, cost_model)
+    root = bitboard.initial_state
+    workers = workers or os.cpu_count() or 1
+
+    # Daemonic processes (e.g. batch solver workers) cannot start children
+    in_process = workers == 1 or multiprocessing.current_process().daemon
+    if in_process:
+        partitions = [BfsPartition(gameboard, action_model, cost_model, i, workers) for i in range(workers)]
+
+        def call(index, command, *payload):
+            return getattr(partitions[index], command)(*payload)
+
+        def call_all(command, payloads):
+            return [call(i, command, *payload) for i, payload in enumerate(payloads)]
+
+        # Expand every partition, then hand each one the children it owns
+        def exchange():
+            expansions = [partition.expand() for partition in partitions]
+            routed = [[pair for _, buckets in expansions for pair in buckets[i]] for i in range(workers)]
+            return [(expanded,) + partition.insert(pairs)
+                    for (expanded, _), partition, pairs in zip(expansions, partitions, routed)]
+    else:
+        # A pipe between every pair of workers carries the buckets they trade
+        peers = [[None] * workers for _ in range(workers)]
+        for i in range(workers):
+            for j in range(i + 1, workers):
+                peers[i][j], peers[j][i] = multiprocessing.Pipe()
+
+        connections, processes = [], []
+        for i in range(workers):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=partition_worker, daemon=True,
+                                              args=(child_end, peers[i], gameboard, action_model, cost_model, i, workers))
+            process.start()
+            connections.append(parent_end)
+            processes.append(process)
+
+        # The workers hold their own copies of the pipes
+        for peer in (peer for row in peers for peer in row if peer is not None):
+            peer.close()
+
+        def call(index, command, *payload):
+            connections[index].send((command, payload))
+            return connections[index].recv()
+
+        # Send a command to every worker first, then collect the answers, so they run in parallel
+        def call_all(command, payloads):
+            for connection, payload in zip(connections, payloads):
+                connection.send((command, payload))
+            return [connection.recv() for connection in connections]
+
+        def exchange():
+            return call_all("exchange", [() for _ in range(workers)])
+
+    try:
+        expanded_nodes = 0
+        layers = [1]
+        goal = root if bitboard.is_solved(root) else None
+        root_pairs = [[] for _ in range(workers)]
+        root_pairs[owner(root, workers)].append((root, None))
+        call_all("insert", [(pairs,) for pairs in root_pairs])
+
+        while goal is None or not stop_at_goal:
+            # Every partition expands its part of the layer and trades the children
+            results = exchange()
+            expanded_nodes += sum(expanded for expanded, _, _ in results)
+
+            layer_size = sum(size for _, size, _ in results)
+            if layer_size == 0:
+                break
+            layers.append(layer_size)
+
+            if goal is None:
+                goal = next((found for _, _, found in results if found is not None), None)
+
+        partition_sizes = call_all("size", [() for _ in range(workers)])
+
+        # Rebuild the path by following parent pointers through their owners
+        path = None
+        if goal is not None:
+            states = [goal]
+            while states[-1] != root:
+                states.append(call(owner(states[-1], workers), "parent", states[-1]))
+            states.reverse()
+            path = [bitboard.to_gameboard(state) for state in states]
+    finally:
+        if not in_process:
+            for connection, process in zip(connections, processes):
+                connection.send(("stop", ()))
+                process.join()
+
+    elapsed, peak = metrics.stop(*(partition.parents for partition in partitions) if in_process else ())
+
+    stats = {"workers": workers, "layers": layers, "partition_sizes": partition_sizes, "states": sum(partition_sizes),
+             "metrics": metrics.mode}
+
+    # Return failure if no goal state was reached
+    if path is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), None, stats)
@@ -0,0 +1,172 @@
+import os
+import math
+import heapq
+from array import array
+from Code import config
+from Code.bitboard import Bitboard
+from Code.gameboard import Gameboard
+
+# Value stored for abstract states from which the exit cannot be reached
+UNREACHABLE = 0xFFFF
+
+# PatternDatabase stores the exact cost to solve an abstraction of a level that
+# keeps only the red car and a few other vehicles (the pattern) along with the
+# level's walls. Removing vehicles only frees cells, so the abstract cost never exceeds the real one and the
+# database is an admissible heuristic.
+# Abstract states are ranked in mixed radix (one digit per pattern vehicle, its
+# lane position) and their costs are kept in a flat array of 16-bit integers,
+# so a lookup reads a few position fields of the state and one array cell.
+class PatternDatabase():
+
+    # Constructor of PatternDatabase class
+    # Input: the bitboard of the level and the IDs of the pattern vehicles (with '#')
+    def __init__(self, bitboard: Bitboard, pattern, costs=None):
+        self.pattern = tuple(pattern)                   # IDs of the vehicles kept in the abstraction
+        slot_of = {vehicle.id: slot for slot, vehicle in enumerate(bitboard.table)}
+        self.slots = [slot_of[vehicle_id] for vehicle_id in self.pattern]
+
+        # Mixed-radix weight of every pattern vehicle's lane position
+        self.radices = []
+        size = 1
+        for slot in self.slots:
+            self.radices.append(size)
+            size *= bitboard.limits[slot] + 1
+        self.size = size                                # Number of abstract states (array length)
+
+        self.shifts = [bitboard.shifts[slot] for slot in self.slots]
+        self.position_mask = bitboard.position_mask
+        self.costs = costs if costs is not None else self.build(bitboard)   # Cost of every abstract state
+
+    # Rank the pattern vehicles' lane positions, indexed like the pattern
+    def rank(self, positions):
+        return sum(position * radix for position, radix in zip(positions, self.radices))
+
+    # Solve the abstraction backwards: a multi-source Dijkstra search from every
+    # abstract goal state (moves are reversible at the same cost)
+    def build(self, bitboard: Bitboard):
+        initial_positions = bitboard.positions(bitboard.initial_state)
+        vehicles = [bitboard.table[slot].to_vehicle(initial_positions[slot]) for slot in self.slots]
+        abstraction = Bitboard(Gameboard(bitboard.width, bitboard.height, vehicles, bitboard.walls),
+                               bitboard.action_model, bitboard.cost_model)
+
+        # Position fields of the pattern vehicles in the abstract bitboard
+        slot_of = {vehicle.id: slot for slot, vehicle in enumerate(abstraction.table)}
+        abstract_shifts = [abstraction.shifts[slot_of[vehicle_id]] for vehicle_id in self.pattern]
+        mask = abstraction.position_mask
+
+        costs = array('H', [UNREACHABLE]) * self.size
+        frontier = [(0, state) for state in abstraction.goal_states()]
+        best = {state: 0 for _, state in frontier}
+
+        while frontier:
+            cost, state = heapq.heappop(frontier)
+            if cost > best[state]:
+                continue
+
+            costs[self.rank([(state >> shift) & mask for shift in abstract_shifts])] = min(cost, UNREACHABLE - 1)
+
+            for move in abstraction.moves(state):
+                next_state = abstraction.apply(state, move)
+                next_cost = cost + move[2]
+                if next_cost < best.get(next_state, UNREACHABLE):
+                    best[next_state] = next_cost
+                    heapq.heappush(frontier, (next_cost, next_state))
+
+        return costs
+
+    # Exact abstract cost of a state of the level (None if the exit is unreachable)
+    def lookup(self, state):
+        index = 0
+        for shift, radix in zip(self.shifts, self.radices):
+            index += ((state >> shift) & self.position_mask) * radix
+
+        cost = self.costs[index]
+        return None if cost == UNREACHABLE else cost
+
+    # Key identifying the database: the level's signature and the pattern
+    @staticmethod
+    def signature(bitboard: Bitboard, pattern):
+        # Imported here: only saving and loading the database need a signature
+        import json
+        import hashlib
+
+        description = json.dumps([bitboard.signature(), list(pattern)])
+        return hashlib.sha1(description.encode()).hexdigest()
+
+    # Write the cost array to a file (named after the signature inside a directory)
+    def save(self, directory, bitboard: Bitboard):
+        os.makedirs(directory, exist_ok=True)
+        file_name = os.path.join(directory, f"pdb_{self.signature(bitboard, self.pattern)}.bin")
+        with open(file_name, "wb") as file:
+            self.costs.tofile(file)
+
+    # Read a previously saved database, or return None if there is none
+    @classmethod
+    def load(cls, directory, bitboard: Bitboard, pattern):
+        file_name = os.path.join(directory, f"pdb_{cls.signature(bitboard, pattern)}.bin")
+        if not os.path.exists(file_name):
+            return None
+
+        database = cls(bitboard, pattern, costs=array('H'))
+        with open(file_name, "rb") as file:
+            database.costs.fromfile(file, database.size)
+        return database
+
+
+# PatternDatabaseHeuristic combines the pattern databases of one level. The red car
+# is in every pattern, so their costs are not additive and the maximum is used.
+# The other vehicles are those that can cover a cell of the exit row in front of the
+# red car, nearest first, split into groups of at most config.PDB_PATTERN_SIZE.
+class PatternDatabaseHeuristic():
+
+    # Constructor of PatternDatabaseHeuristic class
+    # (databases are read from / written to cache_dir when it is given)
+    def __init__(self, bitboard: Bitboard, pattern_size=None, cache_dir=None):
+        pattern_size = pattern_size or config.PDB_PATTERN_SIZE
+        cache_dir = cache_dir if cache_dir is not None else config.PDB_CACHE_DIR
+
+        self.databases = []
+        for pattern in self.patterns(bitboard, pattern_size):
+            database = PatternDatabase.load(cache_dir, bitboard, pattern) if cache_dir else None
+            if database is None:
+                database = PatternDatabase(bitboard, pattern)
+                if cache_dir:
+                    database.save(cache_dir, bitboard)
+            self.databases.append(database)
+
+    # Split the vehicles that can block the red car's way out into patterns
+    @staticmethod
+    def patterns(bitboard: Bitboard, pattern_size):
+        red_vehicle = bitboard.table[bitboard.red_slot]
+        initial_positions = bitboard.positions(bitboard.initial_state)
+        front = initial_positions[bitboard.red_slot] + red_vehicle.length
+        row = bitboard.exit_row
+
+        blockers = []
+        for slot, vehicle in enumerate(bitboard.table):
+            if slot == bitboard.red_slot:
+                continue
+
+            # Vertical vehicles whose column is ahead of the red car (they can cross the exit row)
+            if vehicle.orientation == 'V' and vehicle.lane >= front:
+                blockers.append((vehicle.lane, vehicle.id))
+            # Horizontal vehicles sharing the exit row ahead of the red car
+            elif vehicle.orientation == 'H' and vehicle.lane == row and initial_positions[slot] >= front:
+                blockers.append((initial_positions[slot], vehicle.id))
+
+        blockers = [vehicle_id for _, vehicle_id in sorted(blockers)]
+        if not blockers:
+            return [['#']]
+
+        return [['#'] + blockers[i:i + pattern_size] for i in range(0, len(blockers), pattern_size)]
+
+    # Heuristic value of a state: the largest cost over the databases
+    def __call__(self, state):
+        value = 0
+        for database in self.databases:
+            cost = database.lookup(state)
+            if cost is None:
+                return math.inf
+            if cost > value:
+                value = cost
+        return value
@@ -0,0 +1,158 @@
+import time
+import heapq
+import inspect
+from collections import defaultdict
+from Code import helpFunctions
+from Code.bitboard import Bitboard
+from Code.gameboard import Gameboard
+from Code.heuristicCache import HeuristicCache
+from Code.patternDatabase import PatternDatabase, PatternDatabaseHeuristic
+from Code.retrogradeTable import RetrogradeTable
+from Code.transpositionTable import TranspositionTable
+
+# Hot paths timed while a search is profiled: (owner, attribute, phase)
+HOT_PATHS = [
+    (Bitboard, "moves", "move_generation"),
+    (Bitboard, "successors", "move_generation"),
+    (Bitboard, "weighted_successors", "move_generation"),
+    (Bitboard, "apply", "apply_move"),
+    (Bitboard, "undo", "apply_move"),
+    (Bitboard, "move_between", "apply_move"),
+    (Bitboard, "is_solved", "goal_test"),
+    (Bitboard, "goal_states", "goal_states"),
+    (Bitboard, "blocker_bound", "heuristic"),
+    (Bitboard, "blocking_chain", "heuristic"),
+    (PatternDatabaseHeuristic, "__call__", "heuristic"),
+    (HeuristicCache, "__call__", "heuristic_cache"),
+    (PatternDatabase, "build", "pattern_database_build"),
+    (RetrogradeTable, "build", "retrograde_build"),
+    (TranspositionTable, "get", "transposition_table"),
+    (TranspositionTable, "store", "transposition_table"),
+    (TranspositionTable, "index", "hashing"),
+    (heapq, "heappush", "frontier"),
+    (heapq, "heappop", "frontier"),
+    (Bitboard, "trace_path", "path_reconstruction"),
+    (Bitboard, "replay", "path_reconstruction"),
+    (Bitboard, "join_paths", "path_reconstruction"),
+    (Gameboard, "__init__", "gameboard"),
+    (helpFunctions, "load_gameboard", "load_level"),
+    (helpFunctions, "path_to_moves", "path_to_moves"),
+]
+
+# Profiler times the phases of one search. While it runs, the hot paths above are
+# replaced by timed wrappers (at class / module level, so every caller is seen);
+# they are restored when it stops. Nothing is patched when no search is being
+# profiled, so normal searches pay nothing. Each wrapped call costs about a
+# microsecond, so absolute times are inflated: compare phases with each other.
+# Phases nest: time spent in a phase called from another one (e.g. hashing inside
+# transposition_table) is that phase's self time, and the folded stacks
+# ("search;transposition_table;hashing 1234") can be fed to flamegraph tools.
+class Profiler():
+
+    # Constructor of Profiler class
+    def __init__(self):
+        self.calls = defaultdict(int)     # Phase -> number of calls
+        self.times = defaultdict(float)   # Phase -> seconds, including nested phases
+        self.self_times = defaultdict(float)  # Phase -> seconds, excluding nested phases
+        self.stacks = defaultdict(float)  # Folded stack -> self seconds of its innermost phase
+        self.stack = []                   # Open phases, outermost first
+        self.starts = []                  # perf_counter value when each open phase started
+        self.nested = []                  # Seconds spent in nested phases of each open phase
+        self.patches = []                 # (owner, attribute, original) of the wrapped hot paths
+
+    # Open a phase
+    def enter(self, phase):
+        self.stack.append(phase)
+        self.nested.append(0.0)
+        self.starts.append(time.perf_counter())
+
+    # Close the innermost phase
+    def exit(self):
+        elapsed = time.perf_counter() - self.starts.pop()
+        own = elapsed - self.nested.pop()
+        phase = self.stack[-1]
+
+        self.stacks[";".join(self.stack)] += own
+        self.self_times[phase] += own
+        self.stack.pop()
+
+        # Recursive phases only count their outermost call in the inclusive time
+        if phase not in self.stack:
+            self.times[phase] += elapsed
+        if self.nested:
+            self.nested[-1] += elapsed
+
+    # Timed version of a function (generator functions are timed on every step)
+    def wrap(self, phase, function):
+        if inspect.isgeneratorfunction(function):
+            def timed(*args, **kwargs):
+                self.calls[phase] += 1
+                return self.timed_steps(phase, function(*args, **kwargs))
+        else:
+            def timed(*args, **kwargs):
+                self.calls[phase] += 1
+                self.enter(phase)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.exit()
+        return timed
+
+    # Iterate a generator, timing each step in its phase
+    def timed_steps(self, phase, generator):
+        while True:
+            self.enter(phase)
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                self.exit()
+            yield item
+
+    # Start profiling: wrap the hot paths and open the root "search" phase
+    def start(self):
+        for owner, attribute, phase in HOT_PATHS:
+            original = getattr(owner, attribute)
+            self.patches.append((owner, attribute, original))
+            setattr(owner, attribute, self.wrap(phase, original))
+
+        self.calls["search"] += 1
+        self.enter("search")
+        return self
+
+    # Stop profiling: restore the hot paths and return the profile
+    def stop(self):
+        self.exit()
+        for owner, attribute, original in reversed(self.patches):
+            setattr(owner, attribute, original)
+        self.patches = []
+        return self.profile()
+
+    # Profile as a JSON-ready dictionary: calls, inclusive and self time of every
+    # phase (slowest first), and the folded stacks
+    def profile(self):
+        phases = {phase: {"calls": self.calls[phase], "time": self.times[phase], "self_time": self.self_times[phase]}
+                  for phase in sorted(self.times, key=self.times.get, reverse=True)}
+        return {"phases": phases, "stacks": dict(self.stacks)}
+
+# Run an algorithm with the profiler on; the profile is added to the result's
+# stats["profile"] (the root "search" phase covers the whole call)
+def profile_search(algo_func, gameboard, **kwargs):
+    profiler = Profiler().start()
+    try:
+        result = algo_func(gameboard, **kwargs)
+    finally:
+        profile = profiler.stop()
+
+    result.stats["profile"] = profile
+    return result
+
+# Write the folded stacks of a profile (one "phase;phase;... microseconds" line
+# per stack), the input format of flamegraph.pl, speedscope and similar tools
+def write_folded(profile, file_name):
+    with open(file_name, "w") as file:
+        for stack, seconds in sorted(profile["stacks"].items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds > 0:
+                file.write(f"{stack} {microseconds}\n")
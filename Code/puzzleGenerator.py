@@ -0,0 +1,215 @@
+import os
+import sys
+import time
+import random
+import string
+import argparse
+import multiprocessing
+from Code import config
+from Code import helpFunctions
+from Code.vehicle import Vehicle
+from Code.bitboard import Bitboard
+from Code.gameboard import Gameboard
+from Code.retrogradeTable import RetrogradeTable, UNREACHABLE
+from Code.searchAlgorithms import run_steps, best_first_steps
+
+# IDs given to the generated vehicles besides the red car, in placement order
+VEHICLE_IDS = string.ascii_uppercase + string.ascii_lowercase
+
+# Random boards tried by one task before it gives up on finding a suitable puzzle
+MAX_ATTEMPTS = 1000
+
+# Build a random board: first the red car (length 2) on the exit row, away from the
+# exit, then `wall_count` walls and vehicles of random orientation and length (drawn
+# from `lengths`) on randomly chosen free cells. Neither walls nor horizontal
+# vehicles go on the exit row ahead of the red car, since they could never let it
+# out. Returns the vehicles and the walls.
+def random_board(rng, width, height, vehicle_count, lengths, wall_count=0):
+    exit_row = (height + 1) // 2 - 1
+    occupied = [[False] * width for _ in range(height)]
+
+    def place(vehicle):
+        for i in range(vehicle.length):
+            if vehicle.orientation == 'H':
+                occupied[vehicle.y][vehicle.x + i] = True
+            else:
+                occupied[vehicle.y + i][vehicle.x] = True
+
+    red_car = Vehicle('#', rng.randrange(width - 2), exit_row, 'H', 2)
+    place(red_car)
+    vehicles = [red_car]
+
+    free_cells = [(x, y) for y in range(height) for x in range(width)
+                  if not occupied[y][x] and (y != exit_row or x < red_car.x)]
+    walls = rng.sample(free_cells, min(wall_count, len(free_cells)))
+    for x, y in walls:
+        occupied[y][x] = True
+
+    for vehicle_id in VEHICLE_IDS[:vehicle_count - 1]:
+        orientation = rng.choice("HV")
+        length = rng.choice(lengths)
+
+        # Every free spot for a vehicle of this shape
+        spots = []
+        if orientation == 'H':
+            for y in range(height):
+                for x in range(width - length + 1):
+                    if (y != exit_row or x < red_car.x) and not any(occupied[y][x + i] for i in range(length)):
+                        spots.append((x, y))
+        else:
+            for x in range(width):
+                for y in range(height - length + 1):
+                    if not any(occupied[y + i][x] for i in range(length)):
+                        spots.append((x, y))
+
+        # A crowded board may have no room left for this shape: try the next vehicle
+        if not spots:
+            continue
+
+        x, y = rng.choice(spots)
+        vehicle = Vehicle(vehicle_id, x, y, orientation, length)
+        place(vehicle)
+        vehicles.append(vehicle)
+
+    return vehicles, walls
+
+# Generate one puzzle from a seed. Returns (vehicles, walls, cost), where cost is the
+# optimal solution cost under the options' action and cost models, or None when no
+# board of MAX_ATTEMPTS was suitable. Options (see main() for their meaning):
+# width, height, walls, min_vehicles, max_vehicles, lengths, hardest, min_cost,
+# action_model, cost_model.
+def generate_puzzle(seed, options):
+    rng = random.Random(seed)
+    width, height = options["width"], options["height"]
+
+    for _ in range(MAX_ATTEMPTS):
+        vehicle_count = rng.randint(options["min_vehicles"], options["max_vehicles"])
+        vehicles, walls = random_board(rng, width, height, vehicle_count, options["lengths"], options["walls"])
+        bitboard = Bitboard(Gameboard(width, height, vehicles, walls), options["action_model"], options["cost_model"])
+
+        if options["hardest"]:
+            # Enumerate the state space of the random board and keep its hardest state
+            table = RetrogradeTable(bitboard)
+            cost, index = max(((d, i) for i, d in enumerate(table.distances) if d != UNREACHABLE), default=(None, None))
+            if cost is None:
+                continue
+            vehicles = bitboard.to_gameboard(table.state(index)).vehicles
+        else:
+            # Uniform-cost search gives the optimal cost (None if the board is unsolvable; a
+            # heuristic does not pay off here, since most time goes into exhausting unsolvable boards)
+            _, cost, _, _ = run_steps(best_first_steps(bitboard))
+            if cost is None:
+                continue
+
+        if cost >= options["min_cost"]:
+            return vehicles, bitboard.walls, cost
+
+    return None
+
+# Key of a puzzle that ignores vehicle IDs, so the same board is only written once
+def puzzle_key(vehicles, walls):
+    return tuple(sorted((v.id == '#', v.orientation, v.length, v.x, v.y) for v in vehicles)), tuple(walls)
+
+# Generate `count` distinct puzzles with a pool of worker processes, yielding
+# (vehicles, walls, cost) tuples in seed order. Seeds are consecutive from `seed`, and
+# a seed always gives the same puzzle for the same options, so the same arguments
+# always give the same puzzles.
+def generate_puzzles(count, options, workers=None, seed=0):
+    workers = workers or os.cpu_count() or 1
+    seen = set()
+    next_seed = seed
+
+    with multiprocessing.Pool(workers) as pool:
+        # Duplicates and failed tasks are replaced by a new round of seeds
+        while len(seen) < count:
+            needed = count - len(seen)
+            seeds = range(next_seed, next_seed + needed)
+            next_seed += needed
+
+            chunk_size = max(1, needed // (workers * 8))
+            for puzzle in pool.imap(_generate_puzzle, ((s, options) for s in seeds), chunk_size):
+                if puzzle is None or len(seen) == count:
+                    continue
+
+                key = puzzle_key(puzzle[0], puzzle[1])
+                if key not in seen:
+                    seen.add(key)
+                    yield puzzle
+
+            # Options no board can satisfy would loop forever
+            if len(seen) == 0 and next_seed - seed >= count * 10:
+                raise RuntimeError("No puzzle matches the options")
+
+# Pool entry point (imap passes one argument)
+def _generate_puzzle(arguments):
+    return generate_puzzle(*arguments)
+
+# Generate `count` puzzles (see generate_puzzles) into `directory`, as level files named
+# `prefix` plus their number (from 1, zero-padded). Returns the (file name, cost) pairs.
+def write_puzzles(directory, count, options, workers=None, seed=0, prefix="puzzle"):
+    os.makedirs(directory, exist_ok=True)
+    digits = len(str(count))
+    written = []
+
+    for number, (vehicles, walls, cost) in enumerate(generate_puzzles(count, options, workers, seed), 1):
+        file_name = os.path.join(directory, f"{prefix}{number:0{digits}}.json")
+        helpFunctions.save_gameboard(vehicles, file_name, options["width"], options["height"], walls)
+        written.append((file_name, cost))
+
+    return written
+
+# Read a "MIN-MAX" (or single number) range of the command line
+def parse_range(text):
+    low, _, high = text.partition("-")
+    return int(low), int(high or low)
+
+# Command line entry point:
+#   python -m Code.puzzleGenerator Generated --count 1000 --vehicles 10-14
+#   python -m Code.puzzleGenerator Hardest --count 50 --hardest --min-cost 40
+#   python -m Code.puzzleGenerator Large --width 8 --height 8 --walls 2 --vehicles 14-18
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate random Rush Hour level files.")
+    parser.add_argument("output", help="directory where the level files are written")
+    parser.add_argument("--count", type=int, default=100, help="number of puzzles")
+    parser.add_argument("--width", type=int, default=config.GAMEBOARD_WIDTH, help="board width in cells")
+    parser.add_argument("--height", type=int, default=config.GAMEBOARD_HEIGHT, help="board height in cells")
+    parser.add_argument("--walls", type=int, default=0, help="wall cells per board")
+    parser.add_argument("--vehicles", type=parse_range, default=(8, 13),
+                        help="vehicles per board including the red car, as MIN-MAX (default: 8-13)")
+    parser.add_argument("--lengths", default="2,2,3",
+                        help="comma separated vehicle lengths to draw from; repeat a length to make it likelier (default: 2,2,3)")
+    parser.add_argument("--hardest", action="store_true",
+                        help="write the state with the longest optimal solution in each random board's state space")
+    parser.add_argument("--min-cost", type=int, default=1, help="smallest optimal solution cost kept")
+    parser.add_argument("--action-model", choices=["step", "slide"], default=None)
+    parser.add_argument("--cost-model", choices=["length", "unit"], default=None)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="first random seed")
+    parser.add_argument("--prefix", default="puzzle", help="file name prefix")
+    args = parser.parse_args(argv)
+
+    if args.count < 1:
+        parser.error("the count must be at least 1")
+    if args.width < 3 or args.height < 1:
+        parser.error("the board must be at least 3 cells wide")
+    cell_count = args.width * args.height
+    if not 1 <= args.vehicles[0] <= args.vehicles[1] <= min(len(VEHICLE_IDS) + 1, cell_count // 2):
+        parser.error(f"vehicles must be a range within 1-{min(len(VEHICLE_IDS) + 1, cell_count // 2)}")
+
+    options = {"width": args.width, "height": args.height, "walls": args.walls,
+               "min_vehicles": args.vehicles[0], "max_vehicles": args.vehicles[1],
+               "lengths": [int(length) for length in args.lengths.split(",")],
+               "hardest": args.hardest, "min_cost": args.min_cost,
+               "action_model": args.action_model or config.ACTION_MODEL,
+               "cost_model": args.cost_model or config.COST_MODEL}
+
+    start = time.time()
+    costs = [cost for _, cost in write_puzzles(args.output, args.count, options, args.workers, args.seed, args.prefix)]
+
+    elapsed = time.time() - start
+    print(f"Generated {len(costs)} puzzles in {elapsed:.2f}s ({len(costs) / elapsed * 60:.0f} per minute), "
+          f"optimal cost {min(costs)}-{max(costs)}, mean {sum(costs) / len(costs):.1f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+import math
+import time
 import pygame
 from Code import helpFunctions
 from Code import boardRenderer
 from Code import transition
+from Code.metrics import MEMORY_LABELS
 
 # Render welcome screen with fade-in text
 def render_welcome_screen(SCREEN, background, text_surface, text_rect, alpha, fade_speed):
@@ -44,7 +47,7 @@ def render_algorithm_overlay(SCREEN, select_algo_background, close_button, algor
     for btn in algorithm_buttons:
         btn.draw(SCREEN)
 
-# Show NO SOLUTION overlay
+# Show NO SOLUTION overlay (SEARCH FAILED if the search raised an error)
 def render_no_solution(state, SCREEN, DETAIL_TITLE_FONT):
     elapsed_time = pygame.time.get_ticks() - state["no_solution_time"]  # Time since flag was set
 
@@ -56,7 +59,8 @@ def render_no_solution(state, SCREEN, DETAIL_TITLE_FONT):
         SCREEN.blit(overlay, (0, 0))
 
         # Display "NO SOLUTION" message
-        no_solution_text = DETAIL_TITLE_FONT.render("NO SOLUTION", True, "#ff4444")
+        message = "SEARCH FAILED" if state["search_failed"] else "NO SOLUTION"
+        no_solution_text = DETAIL_TITLE_FONT.render(message, True, "#ff4444")
         rect = no_solution_text.get_rect(center=(SCREEN.get_width() // 2, SCREEN.get_height() // 2))
         SCREEN.blit(no_solution_text, rect)
     
@@ -64,6 +68,38 @@ def render_no_solution(state, SCREEN, DETAIL_TITLE_FONT):
         # Clear flag after timeout
         state["no_solution_flag"] = False
 
+# Show the progress of the running search: animated spinner, elapsed time and expanded nodes
+def render_search_progress(state, SCREEN, FONT, cancel_button):
+    thread = state["solver_thread"]
+
+    # Draw semi-transparent overlay
+    overlay = pygame.Surface((SCREEN.get_width(), SCREEN.get_height()))
+    overlay.set_alpha(220)
+    overlay.fill((0, 0, 0))
+    SCREEN.blit(overlay, (0, 0))
+
+    # Spinner: a ring of dots with a bright head turning eight times per second
+    center_x, center_y = SCREEN.get_width() // 2, 220
+    head = pygame.time.get_ticks() // 125 % 12
+    for i in range(12):
+        angle = math.tau * i / 12
+        shade = 255 - 18 * ((head - i) % 12)
+        position = (center_x + int(30 * math.cos(angle)), center_y + int(30 * math.sin(angle)))
+        pygame.draw.circle(SCREEN, (shade, shade, shade), position, 5)
+
+    # Search details
+    lines = [f"Searching with {state['selected_algorithm'].__name__.replace('_', ' ').upper()}",
+             f"Elapsed time: {time.perf_counter() - thread.start_time:.1f} seconds"]
+    if thread.expanded_nodes is not None:
+        lines.append(f"Expanded nodes: {thread.expanded_nodes}")
+
+    for i, text in enumerate(lines):
+        surface = FONT.render(text, True, "#ffffff")
+        rect = surface.get_rect(center=(center_x, 290 + 30 * i))
+        SCREEN.blit(surface, rect)
+
+    cancel_button.draw(SCREEN)
+
 # Print statistics after solving
 def print_details(state, SCREEN, view_step_button, DETAIL_TITLE_FONT, DETAIL_FONT):
     state["execute_algorithm_flag"] = True  # Switch to detail view
@@ -80,12 +116,18 @@ def print_details(state, SCREEN, view_step_button, DETAIL_TITLE_FONT, DETAIL_FON
     spacing = 45
     line_start_y = title_y + 80
 
+    # How the time and memory numbers were measured
+    metrics_label = {"fast": "fast mode (RSS estimate)", "detailed": "detailed mode (tracemalloc)"}
+
     # List of information entries to show
     entries = [
         ("DETAILS", DETAIL_TITLE_FONT, title_y),
+        (f"{'Cached result, measured' if state['cached_result'] else 'Measured'} in "
+         f"{metrics_label.get(state['metrics_mode'], 'detailed mode (tracemalloc)')}", DETAIL_FONT, title_y + 40),
         (f"Algorithm: {state['selected_algorithm'].__name__.replace('_', ' ').upper()}", DETAIL_FONT, line_start_y),
         (f"Total time: {state['time_execution']:.2f} seconds", DETAIL_FONT, line_start_y + spacing),
-        (f"Peak memory usage: {state['peak_memory'] / (1024 * 1024):.2f} MB", DETAIL_FONT, line_start_y + spacing * 2),
+        (f"{MEMORY_LABELS.get(state['metrics_mode'], MEMORY_LABELS['detailed'])}: {state['peak_memory'] / (1024 * 1024):.2f} MB",
+         DETAIL_FONT, line_start_y + spacing * 2),
         (f"Total expanded nodes: {state['expanded_nodes']}", DETAIL_FONT, line_start_y + spacing * 3),
         (f"Total moves: {state['total_moves']}", DETAIL_FONT, line_start_y + spacing * 4),
         (f"Total cost: {state['total_cost']}", DETAIL_FONT, line_start_y + spacing * 5),
@@ -0,0 +1,184 @@
+import os
+from array import array
+from bisect import bisect_left
+from Code import config
+from Code.bitboard import Bitboard
+
+# Value stored for states from which the exit cannot be reached
+UNREACHABLE = 0xFFFF
+
+# RetrogradeTable holds the exact distance to the goal (under the level's cost
+# model) of every state reachable from a starting state. It is built once:
+#   1. enumerate the whole reachable state space from the starting state
+#   2. run a backward Dijkstra search (bucket queue) from every reachable goal state
+#      (moves are reversible at the same cost, so backward costs are exact)
+# States are stored by rank: the position fields of the integer state (the
+# occupancy bits follow from the positions), kept in a sorted array next to a
+# parallel array of 16-bit distances. After that, solving from any state of the
+# component is a greedy descent that follows distances down to 0.
+class RetrogradeTable():
+
+    # Constructor of RetrogradeTable class (enumerates from the bitboard's initial state
+    # unless another starting state is given). A build given up because `stop` returned
+    # True leaves ranks and distances None.
+    def __init__(self, bitboard: Bitboard, state=None, ranks=None, distances=None, stop=None):
+        self.bitboard = bitboard
+        self.cell_count = bitboard.cell_count
+        if ranks is None:
+            ranks, distances = self.build(bitboard.initial_state if state is None else state, stop)
+
+        self.ranks = ranks              # Sorted ranks of every enumerated state
+        self.distances = distances      # distances[i] -> distance to the goal of ranks[i]
+
+    # Rank of a state: its position fields without the occupancy bits
+    def rank(self, state):
+        return state >> self.cell_count
+
+    # Enumerate the reachable states, then assign distances backwards from the goals.
+    # `stop` is called every config.PROGRESS_INTERVAL enumerated states and once per
+    # distance; (None, None) is returned once it returns True.
+    def build(self, start, stop=None):
+        bitboard = self.bitboard
+
+        # Forward enumeration (depth-first, order does not matter)
+        reachable = {start}
+        stack = [start]
+        expanded = 0
+        while stack:
+            expanded += 1
+            if stop is not None and expanded % config.PROGRESS_INTERVAL == 0 and stop():
+                return None, None
+            for next_state in bitboard.successors(stack.pop()):
+                if next_state not in reachable:
+                    reachable.add(next_state)
+                    stack.append(next_state)
+
+        # Backward Dijkstra search from every reachable goal state. Move costs are small
+        # integers, so the priority queue is a list of buckets indexed by distance
+        distance = {state: 0 for state in reachable if bitboard.is_solved(state)}
+        buckets = [list(distance)]
+        cost = 0
+        while cost < len(buckets):
+            if stop is not None and stop():
+                return None, None
+            for state in buckets[cost]:
+                if distance[state] != cost:
+                    continue
+
+                for previous_state, move_cost in bitboard.weighted_successors(state):
+                    previous_cost = cost + move_cost
+                    if previous_cost < distance.get(previous_state, UNREACHABLE):
+                        distance[previous_state] = previous_cost
+                        while len(buckets) <= previous_cost:
+                            buckets.append([])
+                        buckets[previous_cost].append(previous_state)
+
+            buckets[cost] = None
+            cost += 1
+
+        # Compact storage: sorted ranks (64-bit when they fit) and 16-bit distances
+        states = sorted(reachable)
+        ranks = [self.rank(state) for state in states]
+        if ranks and ranks[-1].bit_length() <= 64:
+            ranks = array('Q', ranks)
+        distances = array('H', (min(distance.get(state, UNREACHABLE), UNREACHABLE) for state in states))
+        return ranks, distances
+
+    # Index of a state in the table, or None if it was not enumerated
+    def index(self, state):
+        rank = self.rank(state)
+        index = bisect_left(self.ranks, rank)
+        if index < len(self.ranks) and self.ranks[index] == rank:
+            return index
+        return None
+
+    # State stored at an index of the table (the occupancy bits are rebuilt from the positions)
+    def state(self, index):
+        bitboard = self.bitboard
+        rank = self.ranks[index]
+        state = (rank << self.cell_count) | bitboard.wall_mask
+        for slot in range(len(bitboard.table)):
+            state |= bitboard.cell_masks[slot][(rank >> (slot * bitboard.position_bits)) & bitboard.position_mask]
+        return state
+
+    # Check if a state belongs to the enumerated state space
+    def __contains__(self, state):
+        return self.index(state) is not None
+
+    # Number of enumerated states
+    def __len__(self):
+        return len(self.ranks)
+
+    # Exact distance of a state to the goal (None if unknown or the exit is unreachable)
+    def distance(self, state):
+        index = self.index(state)
+        if index is None or self.distances[index] == UNREACHABLE:
+            return None
+        return self.distances[index]
+
+    # Greedy descent: from a state, repeatedly play a move whose successor is
+    # exactly the move cost closer to the goal. Returns the moves (None if unsolvable).
+    # Raises ValueError if no move continues the descent (a table that does not
+    # match the level's moves, e.g. a file saved under other cost rules).
+    def solve(self, state):
+        remaining = self.distance(state)
+        if remaining is None:
+            return None
+
+        moves = []
+        while remaining > 0:
+            for move in self.bitboard.moves(state):
+                next_state = self.bitboard.apply(state, move)
+                next_remaining = self.distance(next_state)
+                if next_remaining is not None and next_remaining + move[2] == remaining:
+                    break
+            else:
+                raise ValueError(f"No move leads closer to the goal from distance {remaining}")
+
+            moves.append(move)
+            state, remaining = next_state, next_remaining
+
+        return moves
+
+    # Name of the file holding a table: the level's signature and the smallest rank of
+    # the table's states, so every starting state of the same component shares it
+    @staticmethod
+    def file_name(directory, bitboard: Bitboard, first_rank):
+        return os.path.join(directory, f"retro_{bitboard.signature()}_{first_rank:x}.bin")
+
+    # Write the table to its file (only non-empty tables whose ranks fit in 64 bits can be saved)
+    def save(self, directory):
+        if not isinstance(self.ranks, array) or not self.ranks:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        file_name = self.file_name(directory, self.bitboard, self.ranks[0])
+        with open(file_name, "wb") as file:
+            count = array('Q', [len(self.ranks)])
+            count.tofile(file)
+            self.ranks.tofile(file)
+            self.distances.tofile(file)
+
+    # Read the previously saved table of the level holding a state, or return None if
+    # there is none (a level may have one file per component of its state space)
+    @classmethod
+    def load(cls, directory, bitboard: Bitboard, state):
+        import glob  # Imported here: only loading a saved table searches the directory
+
+        pattern = os.path.join(glob.escape(directory), f"retro_{bitboard.signature()}_*.bin")
+        for file_name in sorted(glob.glob(pattern)):
+            with open(file_name, "rb") as file:
+                count = array('Q')
+                count.fromfile(file, 1)
+                ranks, distances = array('Q'), array('H')
+                ranks.fromfile(file, count[0])
+
+                # Components are disjoint: skip files without the state before reading distances
+                table = cls(bitboard, ranks=ranks, distances=distances)
+                if state not in table:
+                    continue
+                distances.fromfile(file, count[0])
+
+            return table
+
+        return None
@@ -1,263 +1,1001 @@
+import math
 import time
-import tracemalloc
-from queue import PriorityQueue
+import heapq
 from collections import deque
 from Code import config
-from Code import helpFunctions
+from Code.metrics import Metrics
+from Code.bitboard import Bitboard
 from Code.gameboard import Gameboard
-from Code.vehicle import Vehicle
+from Code.transpositionTable import TranspositionTable
+from Code.searchResult import SearchResult
+from Code.patternDatabase import PatternDatabaseHeuristic
+from Code.heuristicCache import HeuristicCache
+from Code.retrogradeTable import RetrogradeTable
+from Code.parallelSearch import parallel_bfs_algorithm
+
+# Retrograde tables built during this session: level signature -> RetrogradeTable
+retrograde_tables = {}
+
+# Algorithms that accept a `stop` function, called every config.PROGRESS_INTERVAL
+# expanded nodes: once it returns True, the search is given up
+STOPPABLE_ALGORITHMS = ("bidirectional_bfs_algorithm", "bidirectional_ucs_algorithm", "ida_star_algorithm",
+                        "anytime_A_star_algorithm", "retrograde_algorithm")
+
+# Result of a search given up by its stop function, with the same "aborted" status
+# as a cancelled SearchSession (so the solution cache does not store it)
+def cancelled_result(metrics, expanded_nodes, *tables):
+    elapsed, peak = metrics.stop(*tables)
+    stats = {"status": "aborted", "reason": "cancelled", "metrics": metrics.mode}
+    return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+# Depth-first search from the root that makes at most `limit` moves.
+# Cycles are checked against the states on the current path only, so memory grows
+# with the depth. The optional fixed-size transposition table remembers the iteration
+# and the smallest depth each state was reached at: a state is skipped only when it
+# is known to be reachable at the same or a smaller depth, so shallower paths to a
+# state are never pruned.
+# Runs as a generator yielding a progress snapshot every `interval` expanded nodes, and
+# returns the solution moves (or None), the number of expanded nodes and whether
+# any state was cut off by the limit (if not, a deeper search cannot help).
+def depth_limited_steps(bitboard: Bitboard, root, limit, table, iteration, interval=None):
+    expanded_nodes = 1
+    cutoff = False
+    next_report = interval or math.inf
+
+    if limit == 0:
+        return None, 0, True
+
+    # Moves played from the root to the current state (the current path)
+    current_state = root
+    path_moves = []
+    on_path = {root}
+
+    # Stack (frontier) of lazy move generators, one for every state on the current path
+    frontier = [bitboard.moves(root)]
+    if table is not None:
+        table.store(root, (iteration, 0))
+
+    while frontier:
+        # Take the next untried move of the deepest state
+        move = next(frontier[-1], None)
+
+        # All moves tried: backtrack by unmaking the move that led here
+        if move is None:
+            frontier.pop()
+            if path_moves:
+                on_path.discard(current_state)
+                current_state = bitboard.undo(current_state, path_moves.pop())
+            continue
+
+        next_state = bitboard.apply(current_state, move)
+        if next_state in on_path:
+            continue
+
+        # Skip states already reached at the same depth in this iteration, or at a
+        # smaller depth in any iteration (that shallower path is still within the limit)
+        depth = len(path_moves) + 1
+        if table is not None:
+            entry = table.get(next_state)
+            if entry is not None and (entry[1] < depth or (entry[0] == iteration and entry[1] == depth)):
+                continue
+            table.store(next_state, (iteration, depth))
+
+        # Check if next state is the goal state
+        if bitboard.is_solved(next_state):
+            return path_moves + [move], expanded_nodes, cutoff
+
+        # Descend into the next state only while its depth stays within the limit
+        if depth < limit:
+            path_moves.append(move)
+            current_state = next_state
+            on_path.add(current_state)
+            frontier.append(bitboard.moves(current_state))
+            expanded_nodes += 1
+
+            # Report progress: the best f of a depth-first iteration is its depth limit
+            if expanded_nodes >= next_report:
+                next_report += interval
+                yield {"expanded_nodes": expanded_nodes, "frontier": len(frontier), "best_f": limit}
+        else:
+            cutoff = True
+
+    return None, expanded_nodes, cutoff
+
+# Run a search generator to completion, ignoring its progress snapshots, and return its result
+def run_steps(steps):
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+# Depth-limited search run to completion (see depth_limited_steps)
+def depth_limited_search(bitboard: Bitboard, root, limit, table, iteration):
+    return run_steps(depth_limited_steps(bitboard, root, limit, table, iteration))
 
 # Depth-Limited Search (DLS) algorithm
-def dls_algorithm(gameboard: Gameboard, limit):
-    #Start memory tracing
-    tracemalloc.start()
+def dls_algorithm(gameboard: Gameboard, limit=None, action_model=None, cost_model=None):
+    # Start measuring time and memory
+    metrics = Metrics().start()
 
-    # Start calculating the time
-    start = time.time()
-    
-    # Number of expanded nodes
-    expanded_nodes = 0
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(gameboard, action_model, cost_model)
+    root = bitboard.initial_state
 
-    # Initialize the stack (frontier) for DLS
-    frontier = deque()
-    
-    # Keep track of visited states to avoid revisiting the same gameboard
-    visited = {}
+    # Search at most `limit` moves deep (a solved root needs no search)
+    limit = config.MAX_LIMIT if limit is None else limit
+    table = TranspositionTable(config.TRANSPOSITION_TABLE_SIZE)
+    if bitboard.is_solved(root):
+        moves, expanded_nodes = [], 0
+    else:
+        moves, expanded_nodes, _ = depth_limited_search(bitboard, root, limit, table, 1)
 
-    # Add the initial gameboard and its depth (0) to the frontier
-    frontier.append((gameboard, 0))
-    visited[gameboard] = (gameboard, None)  # No parent for root
+    elapsed, peak = metrics.stop(table.keys, table.values)
+    stats = {"metrics": metrics.mode}
 
-    while frontier:
-        # Pop the most recent gameboard
-        current_gameboard, depth = frontier.pop()
-        
-        # Skip if depth exceeds the limit
-        if depth > limit:
-            continue
-        
-        # Increment expanded node count
-        expanded_nodes += 1
+    # Return failure if no solution was found within the limit
+    if moves is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
 
-        # Get the successors of the current state
-        for new_vehicles in current_gameboard.check_for_moves():
-            next_gameboard = Gameboard(config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, new_vehicles)
+    path = bitboard.replay(root, moves)
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), None, stats)
 
-            if next_gameboard not in visited:
+# Iterative deepening: depth-limited searches with limits 1, 2, 3, ... up to max_depth.
+# Runs as a generator yielding progress snapshots (expanded nodes counted over all
+# iterations) every `interval` expanded nodes, and returns the solution moves (or
+# None), the total expanded nodes and the per-iteration statistics.
+def iddfs_steps(bitboard: Bitboard, max_depth=None, table=None, interval=None):
+    root = bitboard.initial_state
+    max_depth = config.MAX_LIMIT if max_depth is None else max_depth
 
-                # Check if next gameboard is the goal state
-                if next_gameboard.has_solved():
-                    end = time.time()
-                    _, peak = tracemalloc.get_traced_memory()
+    # Number of expanded nodes over all iterations, and per-iteration statistics
+    expanded_nodes = 0
+    iterations = []
+    moves = [] if bitboard.is_solved(root) else None
+
+    limit = 0
+    while moves is None and limit < max_depth:
+        limit += 1
+        iteration_start = time.perf_counter()
+
+        # Entries are tagged with the iteration, so the table never needs clearing
+        steps = depth_limited_steps(bitboard, root, limit, table, limit, interval)
+        while True:
+            try:
+                snapshot = next(steps)
+            except StopIteration as stop:
+                moves, iteration_expanded, cutoff = stop.value
+                break
+            snapshot["expanded_nodes"] += expanded_nodes
+            yield snapshot
+
+        expanded_nodes += iteration_expanded
+        iterations.append({"depth_limit": limit, "expanded_nodes": iteration_expanded,
+                           "time": time.perf_counter() - iteration_start})
+
+        # Nothing was cut off by the limit: every reachable state has been searched
+        if not cutoff:
+            break
+
+    return moves, expanded_nodes, iterations
+
+# Iterative Deepening DFS (IDDFS) algorithm
+def iddfs_algorithm(gameboard: Gameboard, max_depth=None, action_model=None, cost_model=None, table_size=None):
+    """
+    Solves the Rush Hour puzzle using Iterative Deepening Depth-First Search.
 
-                    tracemalloc.stop()
+    Runs depth-limited searches with limits 1, 2, 3, ... so the first solution found
+    uses the fewest moves, while memory stays proportional to the depth plus a
+    fixed-size transposition table (table_size=0 keeps only path cycle checks).
 
-                    path = helpFunctions.trace_back_solution(visited, gameboard, current_gameboard)
-                    path.append(next_gameboard)
+    Input:
+        gameboard (Gameboard): The starting configuration of the Rush Hour game
+        max_depth (int): Deepest limit to try (defaults to config.MAX_LIMIT)
+        action_model (str): "step" or "slide" (defaults to config.ACTION_MODEL)
+        cost_model (str): "length" or "unit" (defaults to config.COST_MODEL)
+        table_size (int): Transposition table slots (defaults to config.TRANSPOSITION_TABLE_SIZE)
 
-                    return path, end-start, peak, expanded_nodes, len(path), None
+    Output:
+        SearchResult with stats["iterations"]: one dictionary per depth limit
+        holding the limit, its expanded nodes and its time
+    """
+    # Start measuring time and memory
+    metrics = Metrics().start()
 
-                visited[next_gameboard] = (next_gameboard, current_gameboard)
-                frontier.append((next_gameboard, depth + 1))
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(gameboard, action_model, cost_model)
+    root = bitboard.initial_state
 
-    # Return failure if no solution was found within the limit
-    end = time.time()
-    _, peak = tracemalloc.get_traced_memory()
+    table_size = config.TRANSPOSITION_TABLE_SIZE if table_size is None else table_size
+    table = TranspositionTable(table_size) if table_size > 0 else None
 
-    tracemalloc.stop()
-    return None, end-start, peak, expanded_nodes, None, None
+    moves, expanded_nodes, iterations = run_steps(iddfs_steps(bitboard, max_depth, table))
 
-# BFS algorithm
-def bfs_algorithm(gameboard: Gameboard):
-    #Start memory tracing
-    tracemalloc.start()
+    elapsed, peak = metrics.stop(*((table.keys, table.values) if table is not None else ()))
 
-    # Get start time currently
-    start = time.time()
+    stats = {"iterations": iterations, "metrics": metrics.mode}
+    if table is not None:
+        stats["table_hits"], stats["table_misses"] = table.hits, table.misses
+
+    # Return failure if no solution was found within the maximum depth
+    if moves is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+    path = bitboard.replay(root, moves)
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), None, stats)
+
+# Breadth-first search from the initial state, goals checked when generated.
+# Runs as a generator yielding a progress snapshot every `interval` expanded nodes, and
+# returns the goal state reached (or None), the parent links and the number of expanded nodes.
+def bfs_steps(bitboard: Bitboard, interval=None):
+    root = bitboard.initial_state
+    next_report = interval or math.inf
 
     # Number of expanded nodes
     expanded_nodes = 0
+
     # Initialize the queue for BFS
     queue = deque()
-    # Keep track of visited states to avoid cycles
+    # Keep track of visited states (and their parents) to avoid cycles
     visited = {}
 
     # Add the start state to the queue and mark it as visited
-    queue.append(gameboard)
-    visited[gameboard] = (gameboard, None)
+    queue.append(root)
+    visited[root] = None
 
     # While there are states to explore in the queue
     while queue:
         # Get the current state from the queue and increase the expanded nodes count
-        current_gameboard = queue.popleft()
+        current_state = queue.popleft()
         expanded_nodes += 1
 
         # Get the successors of the current state
-        for new_vehicles in current_gameboard.check_for_moves():
-            next_gameboard = Gameboard(config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, new_vehicles)
+        for next_state in bitboard.successors(current_state):
             # If the next state has not been visited yet
-            if next_gameboard not in visited:
+            if next_state not in visited:
+                visited[next_state] = current_state
+
                 # Check if the next state has solved the game
-                if next_gameboard.has_solved():
-                    end = time.time()
-                    _, peak = tracemalloc.get_traced_memory()
-                    tracemalloc.stop()
+                if bitboard.is_solved(next_state):
+                    return next_state, visited, expanded_nodes
 
-                    path = helpFunctions.trace_back_solution(visited, gameboard, current_gameboard)
-                    path.append(next_gameboard)
+                # If not solved, add the next state to the queue
+                queue.append(next_state)
 
-                    return path, end-start, peak, expanded_nodes, len(path), None
-                
-                # If not solved, add the next state to the queue and mark it as visited
-                queue.append(next_gameboard)
-                visited[next_gameboard] = (next_gameboard, current_gameboard)
+        # Report progress: the best f of BFS is the number of moves of the oldest queued state
+        if expanded_nodes >= next_report and queue:
+            next_report += interval
+            depth, state = 0, visited[queue[0]]
+            while state is not None:
+                depth, state = depth + 1, visited[state]
+            yield {"expanded_nodes": expanded_nodes, "frontier": len(queue), "best_f": depth}
 
-    # If no solution is found, return None and print statistics
-    end = time.time()
-    _, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    
-    return None, end-start, peak, expanded_nodes, None, None
+    return None, visited, expanded_nodes
 
-# UCS algorithm
-def ucs_algorithm(game_board: Gameboard):
-    #Start memory tracing
-    tracemalloc.start()
-    
-    # Start calculating the time
-    start = time.time()
-    
-    # Number of expanded nodes
-    expanded_nodes = 0
-    
-    # Initialize the priority queue
-    frontier = PriorityQueue()
+# BFS algorithm
+def bfs_algorithm(gameboard: Gameboard, action_model=None, cost_model=None):
+    # Start measuring time and memory
+    metrics = Metrics().start()
 
-    node_counter = 0 # Used to break ties in priority queue
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(gameboard, action_model, cost_model)
+    goal_state, visited, expanded_nodes = run_steps(bfs_steps(bitboard))
 
-    # Keep track of visited states to avoid cycles
-    visited = {}
-    
-    # Push the initial state into the priority queue with cost 0
-    frontier.put((0, node_counter, game_board))
-    visited[game_board] = (0, game_board)
-    
-    while not frontier.empty():
-        # Get the state with the lowest cost
-        current_cost, _, current_board = frontier.get()
+    elapsed, peak = metrics.stop(visited)
+    stats = {"metrics": metrics.mode}
 
-        if current_board in visited and current_cost > visited[current_board][0]:
+    # If no solution is found, return None and print statistics
+    if goal_state is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+    path = bitboard.trace_path(visited, goal_state)
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), None, stats)
+
+# Heuristics that never overestimate the remaining cost, under every action and cost
+# model: with them, A*, IDA* and ARA* (at weight 1) return optimal solutions
+ADMISSIBLE_HEURISTICS = ("blockers", "pattern_database")
+
+# Build the heuristic function (state -> estimate of the remaining cost) of a level
+#   "blockers"         - cost of moving the red car and the vehicles in front of it
+#   "blocking_chain"   - number of vehicles in the red car's blocking chain (not admissible)
+#   "pattern_database" - maximum over the level's pattern databases
+def select_heuristic(bitboard: Bitboard, name=None):
+    name = name or config.HEURISTIC
+    if name == "blockers":
+        return bitboard.blocker_bound
+    if name == "blocking_chain":
+        return bitboard.blocking_chain
+    if name == "pattern_database":
+        return PatternDatabaseHeuristic(bitboard)
+    raise ValueError(f"Unknown heuristic: {name}")
+
+# Best-first search shared by UCS and A*.
+# The frontier is a binary heap (heapq) of (f, h, tie counter, g, state) entries, so
+# g and h never have to be recomputed when an entry is popped. A cheaper path to a
+# state pushes a new entry instead of updating the old one; outdated entries are
+# skipped when popped (lazy deletion). Popped states go into a closed set, and a
+# closed state is only expanded again if a cheaper path to it is found later, which
+# an inconsistent heuristic can cause; those re-expansions are counted.
+# Runs as a generator yielding a progress snapshot every `interval` expanded nodes, and
+# returns the goal state reached (or None), its cost, the parent links and the statistics.
+def best_first_steps(bitboard: Bitboard, heuristic=None, interval=None):
+    root = bitboard.initial_state
+    root_h = heuristic(root) if heuristic is not None else 0
+    next_report = interval or math.inf
+
+    frontier = [(root_h, root_h, 0, 0, root)]
+    node_counter = 0 # Used to break ties in the heap
+    best_g = {root: 0} # Cheapest known cost of every generated state
+    parents = {root: None} # Parent of every state on its cheapest known path
+    closed = set() # States already expanded
+
+    stats = {"expanded_nodes": 0, "reexpanded_nodes": 0, "stale_entries": 0, "max_frontier": 1}
+
+    while frontier:
+        # Get the entry with the lowest f score (ties: lowest h, then oldest)
+        f, _, _, g, current_state = heapq.heappop(frontier)
+
+        # Lazy deletion: skip entries superseded by a cheaper path
+        if g > best_g[current_state]:
+            stats["stale_entries"] += 1
             continue
-        
-        expanded_nodes += 1
-        
-        # If we reach the goal state i.e. solved, return the path
-        if current_board.has_solved():
-            # Final statistics for running time and peak memory usage
-            end = time.time()
-            _, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            
-            path = helpFunctions.trace_back_solution(visited, game_board, current_board)
-            return path, end-start, peak, expanded_nodes, len(path), current_cost
-        
-        # Generate successors and their costs
-        # Generate successors
-        for new_vehicles in current_board.check_for_moves():
-            new_game_board = Gameboard(config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, new_vehicles)
-            
-            # calculate new cost
-            new_cost = current_cost
-            for vehicle in new_vehicles:
-                if vehicle not in current_board.vehicles:
-                    new_cost += vehicle.length
-                    break
 
-            # Check if this state is new or has better priority than previous visit
-            if new_game_board not in visited or new_cost < visited[new_game_board][0]:
+        if current_state in closed:
+            stats["reexpanded_nodes"] += 1
+        closed.add(current_state)
+        stats["expanded_nodes"] += 1
+
+        # The first goal popped is reached by a cheapest path
+        if bitboard.is_solved(current_state):
+            return current_state, g, parents, stats
+
+        # Generate successors, each move carrying its own cost
+        for move in bitboard.moves(current_state):
+            next_state = bitboard.apply(current_state, move)
+            next_g = g + move[2]
+
+            # Push the state if it is new or reached more cheaply than before
+            if next_g < best_g.get(next_state, math.inf):
+                best_g[next_state] = next_g
+                parents[next_state] = current_state
+                next_h = heuristic(next_state) if heuristic is not None else 0
                 node_counter += 1
-                frontier.put((new_cost, node_counter, new_game_board))
-                visited[new_game_board] = (new_cost, new_game_board, current_board)
-    
-    # Statistics: If no solution is found
+                heapq.heappush(frontier, (next_g + next_h, next_h, node_counter, next_g, next_state))
+
+        stats["max_frontier"] = max(stats["max_frontier"], len(frontier))
+
+        # Report progress: f of the last expanded state
+        if stats["expanded_nodes"] >= next_report:
+            next_report += interval
+            yield {"expanded_nodes": stats["expanded_nodes"], "frontier": len(frontier), "best_f": f}
+
+    return None, None, parents, stats
+
+# Best-first search run to completion (see best_first_steps)
+def best_first_search(bitboard: Bitboard, heuristic=None):
+    return run_steps(best_first_steps(bitboard, heuristic))
+
+# UCS algorithm
+def ucs_algorithm(game_board: Gameboard, action_model=None, cost_model=None):
+    # Start measuring time and memory
+    metrics = Metrics().start()
     
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(game_board, action_model, cost_model)
+
+    # Expand states in order of path cost only
+    goal_state, cost, parents, stats = best_first_search(bitboard)
+
     # Final statistics for running time and peak memory usage
-    end = time.time()
-    current, peak = tracemalloc.get_traced_memory()
-    
-    tracemalloc.stop()
+    elapsed, peak = metrics.stop(parents)
+    stats["metrics"] = metrics.mode
+
     # If no solution is found, return None
-    return None, end-start, peak, expanded_nodes, None, None
+    if goal_state is None:
+        return SearchResult(None, elapsed, peak, stats["expanded_nodes"], None, None, stats)
+
+    path = bitboard.trace_path(parents, goal_state)
+    return SearchResult(path, elapsed, peak, stats["expanded_nodes"], len(path), cost, stats)
 
 # A* algorithm
-def A_star_algorithm(game_board):
+def A_star_algorithm(game_board, action_model=None, cost_model=None, heuristic=None):
     """
     Solves the Rush Hour puzzle using A* search algorithm.
     
     Input:
         initial_board (Gameboard): The starting configuration of the Rush Hour game
+        action_model (str): "step" or "slide" (defaults to config.ACTION_MODEL)
+        cost_model (str): "length" or "unit" (defaults to config.COST_MODEL)
+        heuristic (str): "blockers", "blocking_chain" or "pattern_database" (defaults to config.HEURISTIC)
         
     Output:
-        Gameboard: The solved board configuration if found, None otherwise
+        SearchResult: the usual 6-tuple, with frontier statistics (expanded,
+        re-expanded and stale entries, largest frontier) in its stats
     """
-    start_time = time.time()
-    tracemalloc.start()
-
-    # Initialize priority queue for frontier nodes
-    frontier = PriorityQueue()
-    node_counter = 0 # Used to break ties in priority queue
-    num_expanded_node = 0 # Used to count expanded node
-    visited = {} # Dictionary to track visited states and their priorities
+    # Start measuring time and memory
+    metrics = Metrics().start()
 
-    # Calculate initial heuristic (number of vehicles blocking the target vehicle)
-    heuristic_value_root = helpFunctions.heuristic_blocking_chain(game_board)
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(game_board, action_model, cost_model)
 
-    # Add initial state to frontier
-    frontier.put((heuristic_value_root, node_counter, game_board))
-    visited[game_board] = (heuristic_value_root, game_board)
+    # Expand states in order of f = g + h (heuristic values are memoized)
+    estimate = HeuristicCache(select_heuristic(bitboard, heuristic), config.HEURISTIC_CACHE_SIZE)
+    goal_state, cost, parents, stats = best_first_search(bitboard, estimate)
+    stats.update(estimate.stats())
 
-    while not frontier.empty():
-        # Get the next node with lowest priority (f = g + h)
-        current_priority, _, current_board = frontier.get()
-        num_expanded_node += 1
+    elapsed, peak = metrics.stop(parents, estimate.values)
+    stats["metrics"] = metrics.mode
 
-        # Subtract heuristic to get actual path cost (g) from f score
-        current_priority -= helpFunctions.heuristic_blocking_chain(current_board)
+    # if no solution is found, return None
+    if goal_state is None:
+        return SearchResult(None, elapsed, peak, stats["expanded_nodes"], None, None, stats)
+
+    path = bitboard.trace_path(parents, goal_state)
+    return SearchResult(path, elapsed, peak, stats["expanded_nodes"], len(path), cost, stats)
+
+# Bidirectional BFS algorithm. The backward search starts from every goal state, and
+# on a Rush Hour board that goal set is large (every placement of the other vehicles:
+# 123178 states, about a quarter of the reachable ones, on level 9). Expanding it
+# costs more than the forward layers it would save, so the backward search only
+# starts once the goal set is no larger than the forward layer (counted by a capped
+# enumeration, retried whenever the layer has doubled). Until then this is a forward
+# BFS: levels with a large goal set expand as many nodes as bfs_algorithm.
+def bidirectional_bfs_algorithm(gameboard: Gameboard, action_model=None, cost_model=None, stop=None):
+    # Start measuring time and memory
+    metrics = Metrics().start()
 
-        # Check if current state is the solution
-        if current_board.has_solved():
-            end_time = time.time()
-            _, peak = tracemalloc.get_traced_memory()
+    # Number of expanded nodes
+    expanded_nodes = 0
 
-            tracemalloc.stop()
-            path = helpFunctions.trace_back_solution(visited, game_board, current_board)
-            return path, end_time-start_time, peak, num_expanded_node, len(path), current_priority
-        
-        # Generate all possible moves from current state
-        for new_vehicles in current_board.check_for_moves():
-            # Create new game board from this move configuration
-            new_game_board = Gameboard(config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, new_vehicles)
-
-            # Calculate new path cost (g)
-            # Add vehicle length as cost when it moves
-            new_priority = current_priority
-            for vehicle in new_vehicles:
-                if vehicle not in current_board.vehicles:
-                    new_priority += vehicle.length 
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(gameboard, action_model, cost_model)
+    root = bitboard.initial_state
+
+    # Parent links of both searches: forward links lead back to the initial state,
+    # backward links lead to a goal state (None until the backward search starts).
+    # Every move can be undone by the opposite move, so the backward search generates
+    # successors exactly like the forward one.
+    forward_visited = {root: None}
+    backward_visited = None
+
+    # Current BFS layers of both searches
+    forward_layer = [root]
+    backward_layer = []
+    goal_limit = 1 # Forward layer size at which the goal set is counted next
+
+    meeting_state = root if bitboard.is_solved(root) else None
+
+    while meeting_state is None and forward_layer and (backward_visited is None or backward_layer):
+        # Start the backward search once the goal set is no larger than the forward layer
+        if backward_visited is None and len(forward_layer) >= goal_limit:
+            goals = bitboard.goal_states(len(forward_layer))
+            if goals is None:
+                goal_limit = 2 * len(forward_layer)
+            else:
+                backward_visited = {goal: None for goal in goals}
+                backward_layer = goals
+                if not backward_layer:
                     break
 
-            # Calculate new f score (f = g + h)
-            new_priority += helpFunctions.heuristic_blocking_chain(new_game_board)
+        # Expand the smaller layer next (the forward one while searching forward only)
+        if backward_visited is None or len(forward_layer) <= len(backward_layer):
+            layer, visited, other_visited = forward_layer, forward_visited, backward_visited
+        else:
+            layer, visited, other_visited = backward_layer, backward_visited, forward_visited
+
+        next_layer = []
+        for current_state in layer:
+            if stop is not None and expanded_nodes % config.PROGRESS_INTERVAL == 0 and stop():
+                return cancelled_result(metrics, expanded_nodes, forward_visited, backward_visited)
+            expanded_nodes += 1
+
+            for next_state in bitboard.successors(current_state):
+                if next_state not in visited:
+                    visited[next_state] = current_state
+
+                    # The first state reached by both searches (or the first goal state,
+                    # while searching forward only) closes a shortest path
+                    if next_state in other_visited if other_visited is not None else bitboard.is_solved(next_state):
+                        meeting_state = next_state
+                        break
+
+                    next_layer.append(next_state)
+
+            if meeting_state is not None:
+                break
+
+        if layer is forward_layer:
+            forward_layer = next_layer
+        else:
+            backward_layer = next_layer
 
-            # Check if this state is new or has better priority than previous visit
-            if new_game_board not in visited or new_priority < visited[new_game_board][0]:
+    # A goal reached by the forward search alone ends the path
+    if backward_visited is None:
+        backward_visited = {meeting_state: None}
+
+    elapsed, peak = metrics.stop(forward_visited, backward_visited)
+    stats = {"metrics": metrics.mode}
+
+    # If no solution is found, return None
+    if meeting_state is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+    path = bitboard.join_paths(forward_visited, backward_visited, meeting_state)
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), None, stats)
+
+# Bidirectional UCS algorithm. As in bidirectional_bfs_algorithm, the backward search
+# only starts from the goal states once there are no more of them than forward frontier
+# entries; until then this is a forward UCS that stops at the cheapest goal.
+def bidirectional_ucs_algorithm(game_board: Gameboard, action_model=None, cost_model=None, stop=None):
+    # Start measuring time and memory
+    metrics = Metrics().start()
+
+    # Number of expanded nodes
+    expanded_nodes = 0
+
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(game_board, action_model, cost_model)
+    root = bitboard.initial_state
+
+    node_counter = 0 # Used to break ties in the priority queues
+
+    # Forward search starts from the initial state with cost 0
+    forward_frontier = [(0, node_counter, root)]
+    forward_costs = {root: 0}
+    forward_parents = {root: None}
+
+    # Backward search starts from every goal state with cost 0, once it pays off
+    backward_frontier = []
+    backward_costs = {}
+    backward_parents = {}
+    backward_started = False
+    goal_limit = 1 # Forward frontier size at which the goal set is counted next
+
+    # Cheapest path found so far and the state where both searches met on it
+    best_cost, meeting_state = (0, root) if bitboard.is_solved(root) else (None, None)
+
+    while forward_frontier or backward_frontier:
+        # Start the backward search once the goal set is no larger than the forward frontier
+        if not backward_started and len(forward_frontier) >= goal_limit:
+            goals = bitboard.goal_states(len(forward_frontier))
+            if goals is None:
+                goal_limit = 2 * len(forward_frontier)
+            else:
+                backward_started = True
+                for goal in goals:
+                    node_counter += 1
+                    backward_frontier.append((0, node_counter, goal))
+                    backward_costs[goal] = 0
+                    backward_parents[goal] = None
+
+        # An exhausted search contributes a lower bound of 0
+        forward_top = forward_frontier[0][0] if forward_frontier else 0
+        backward_top = backward_frontier[0][0] if backward_frontier else 0
+
+        # Stop once no pair of frontier states can beat the best path found
+        if best_cost is not None and forward_top + backward_top >= best_cost:
+            break
+
+        # Expand the search with the smaller frontier (the stopping rule holds either way)
+        if forward_frontier and (not backward_frontier or len(forward_frontier) <= len(backward_frontier)):
+            frontier, costs, parents, other_costs = forward_frontier, forward_costs, forward_parents, backward_costs
+        else:
+            frontier, costs, parents, other_costs = backward_frontier, backward_costs, backward_parents, forward_costs
+
+        current_cost, _, current_state = heapq.heappop(frontier)
+        if current_cost > costs[current_state]:
+            continue
+
+        if stop is not None and expanded_nodes % config.PROGRESS_INTERVAL == 0 and stop():
+            return cancelled_result(metrics, expanded_nodes, forward_costs, forward_parents,
+                                    backward_costs, backward_parents)
+        expanded_nodes += 1
+
+        # Moves are reversible with the same cost, so both searches use the same moves
+        for move in bitboard.moves(current_state):
+            next_state = bitboard.apply(current_state, move)
+            new_cost = current_cost + move[2]
+
+            if next_state not in costs or new_cost < costs[next_state]:
                 node_counter += 1
-                frontier.put((new_priority, node_counter, new_game_board))
-                visited[new_game_board] = (new_priority, new_game_board, current_board)
-    
+                heapq.heappush(frontier, (new_cost, node_counter, next_state))
+                costs[next_state] = new_cost
+                parents[next_state] = current_state
+
+                # Record a cheaper path through a state reached by both searches (or
+                # through a goal state, while searching forward only)
+                other_cost = other_costs.get(next_state)
+                if other_cost is None and not backward_started and bitboard.is_solved(next_state):
+                    other_cost = 0
+                if other_cost is not None:
+                    total_cost = new_cost + other_cost
+                    if best_cost is None or total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting_state = next_state
+
+    # A goal reached by the forward search alone ends the path
+    if not backward_started:
+        backward_parents = {meeting_state: None}
+
+    elapsed, peak = metrics.stop(forward_costs, forward_parents, backward_costs, backward_parents)
+    stats = {"metrics": metrics.mode}
+
+    # If no solution is found, return None
+    if meeting_state is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+    path = bitboard.join_paths(forward_parents, backward_parents, meeting_state)
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), best_cost, stats)
+
+# IDA* algorithm
+def ida_star_algorithm(game_board, action_model=None, cost_model=None, heuristic=None, stop=None):
+    """
+    Solves the Rush Hour puzzle using Iterative Deepening A* (IDA*).
+
+    Every iteration is a depth-first search that prunes states whose f = g + h
+    exceeds the current threshold. Memory stays bounded: the search keeps only
+    the current path and a fixed-size transposition table holding, for each state,
+    the iteration and g it was last reached with and its backed-up heuristic value
+    (a lower bound on its remaining cost, raised as its subtree is explored).
+
+    With vehicle-length costs, raising the threshold to the smallest pruned f would
+    need one iteration per cost unit, so the next threshold is chosen to roughly
+    double the work of each iteration. Once a solution is found, the iteration
+    continues as branch and bound (pruning f >= best cost), so the returned
+    solution is still the cheapest one.
+
+    Input:
+        game_board (Gameboard): The starting configuration of the Rush Hour game
+        action_model (str): "step" or "slide" (defaults to config.ACTION_MODEL)
+        cost_model (str): "length" or "unit" (defaults to config.COST_MODEL)
+        heuristic (str): "blockers", "blocking_chain" or "pattern_database" (defaults to config.HEURISTIC)
+        stop (function): Gives the search up once it returns True (see STOPPABLE_ALGORITHMS)
+
+    Output:
+        SearchResult with the number of iterations, transposition table and
+        heuristic cache counters in its stats
+    """
+    # Start measuring time and memory
+    metrics = Metrics().start()
+
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(game_board, action_model, cost_model)
+    root = bitboard.initial_state
+
+    num_expanded_node = 0 # Used to count expanded node
+    table = TranspositionTable(config.TRANSPOSITION_TABLE_SIZE)
+    estimate = HeuristicCache(select_heuristic(bitboard, heuristic), config.HEURISTIC_CACHE_SIZE)
+
+    # Heuristic value of a state: its backed-up value if known, else the estimate
+    def heuristic(state):
+        entry = table.get(state)
+        return entry[2] if entry is not None else estimate(state)
+
+    # Order the successors of a state by f score so promising moves are tried first
+    def ordered_successors(state, g):
+        children = []
+        for move in bitboard.moves(state):
+            next_state = bitboard.apply(state, move)
+            next_h = heuristic(next_state)
+            children.append((g + move[2] + next_h, next_h, move))
+
+        children.sort(key=lambda child: child[0])
+        return iter(children)
+
+    # The first threshold is the heuristic value of the initial state
+    threshold = estimate(root)
+    best_moves, best_cost = ([], 0) if bitboard.is_solved(root) else (None, None)
+    iteration = 0
+
+    while best_moves is None:
+        iteration += 1
+        iteration_expanded = 0
+        pruned_counts = {}  # f score -> number of successors pruned with it
+        table.store(root, (iteration, 0, threshold))
+
+        # Depth-first search state: the current state, its g and h, the moves leading
+        # to it, and for every state on the path an iterator of ordered successors
+        # plus the lowest remaining-cost bound found among its successors so far
+        current_state, current_g, current_h = root, 0, threshold
+        moves_made, g_values, h_values = [], [], []
+        frontier = [ordered_successors(root, 0)]
+        bounds = [math.inf]
+        iteration_expanded += 1
+
+        while frontier:
+            child = next(frontier[-1], None)
+
+            # All successors tried: back up the new bound and unmake the move that led here
+            if child is None:
+                frontier.pop()
+                backed_up_h = max(current_h, bounds.pop())
+                table.store(current_state, (iteration, current_g, backed_up_h))
+
+                if moves_made:
+                    move = moves_made.pop()
+                    bounds[-1] = min(bounds[-1], move[2] + backed_up_h)
+                    current_state = bitboard.undo(current_state, move)
+                    current_g, current_h = g_values.pop(), h_values.pop()
+                continue
+
+            f, next_h, move = child
+            next_g = current_g + move[2]
+
+            # Successors are sorted, so the rest of this list exceeds the bound too
+            if f > threshold or (best_cost is not None and f >= best_cost):
+                for pruned_f, _, _ in [child, *frontier[-1]]:
+                    pruned_counts[pruned_f] = pruned_counts.get(pruned_f, 0) + 1
+                bounds[-1] = min(bounds[-1], f - current_g)
+                continue
+
+            # Skip states already reached at least as cheaply in this iteration, or more
+            # cheaply in an earlier one (that cheaper path is still within the threshold)
+            next_state = bitboard.apply(current_state, move)
+            entry = table.get(next_state)
+            if entry is not None and (entry[1] < next_g or (entry[0] == iteration and entry[1] == next_g)):
+                bounds[-1] = min(bounds[-1], move[2] + entry[2])
+                continue
+            table.store(next_state, (iteration, next_g, next_h))
+
+            # Keep the cheapest solution and only look for cheaper ones from now on
+            if bitboard.is_solved(next_state):
+                best_moves, best_cost = moves_made + [move], next_g
+                bounds[-1] = min(bounds[-1], move[2])
+                continue
+
+            if stop is not None and iteration_expanded % config.PROGRESS_INTERVAL == 0 and stop():
+                return cancelled_result(metrics, num_expanded_node + iteration_expanded,
+                                        table.keys, table.values, estimate.values)
+
+            # Descend into the successor
+            moves_made.append(move)
+            g_values.append(current_g)
+            h_values.append(current_h)
+            current_state, current_g, current_h = next_state, next_g, next_h
+            frontier.append(ordered_successors(current_state, current_g))
+            bounds.append(math.inf)
+            iteration_expanded += 1
+
+        num_expanded_node += iteration_expanded
+
+        # Every state was explored without exceeding the threshold: no solution
+        if best_moves is None and not pruned_counts:
+            break
+
+        # Raise the threshold until about as many pruned successors fit under it as
+        # states were expanded in this iteration (at least to the smallest pruned f)
+        admitted = 0
+        for pruned_f in sorted(pruned_counts):
+            threshold = pruned_f
+            admitted += pruned_counts[pruned_f]
+            if admitted >= iteration_expanded:
+                break
+
+    elapsed, peak = metrics.stop(table.keys, table.values, estimate.values)
+
+    stats = {"iterations": iteration, "table_hits": table.hits, "table_misses": table.misses, "metrics": metrics.mode}
+    stats.update(estimate.stats())
+
     # if no solution is found, return None
-    end_time = time.time()
-    _, peak = tracemalloc.get_traced_memory()
+    if best_moves is None:
+        return SearchResult(None, elapsed, peak, num_expanded_node, None, None, stats)
+
+    path = bitboard.replay(root, best_moves)
+    return SearchResult(path, elapsed, peak, num_expanded_node, len(path), best_cost, stats)
+
+# Anytime weighted A* algorithm (ARA*)
+def anytime_A_star_algorithm(game_board, time_limit=None, weight=None, weight_decay=None,
+                             action_model=None, cost_model=None, heuristic=None, report=None, stop=None):
+    """
+    Solves the Rush Hour puzzle with Anytime Repairing A* (ARA*) within a time budget.
+
+    The first pass is weighted A* (f = g + weight * h), which finds a solution
+    quickly. Every later pass lowers the weight towards 1 and repairs the previous search
+    instead of starting over: states whose cost improved after being expanded
+    are kept aside and re-queued, and the frontier is re-keyed with the new
+    weight. With an admissible heuristic (see ADMISSIBLE_HEURISTICS), each pass that
+    ends in time yields a solution whose cost is at most `bound` times the optimal
+    one, and with weight 1 the solution is optimal; with any other heuristic no
+    bound is known and it is reported as None. When the deadline passes, the best solution found so far is returned (None if the
+    first pass has not finished yet).
+
+    Input:
+        game_board (Gameboard): The starting configuration of the Rush Hour game
+        time_limit (float): Seconds allowed (defaults to config.ANYTIME_TIME_LIMIT)
+        weight (float): First heuristic weight (defaults to config.ANYTIME_INITIAL_WEIGHT)
+        weight_decay (float): Share of (weight - 1) kept after each pass (defaults to config.ANYTIME_WEIGHT_DECAY)
+        action_model (str): "step" or "slide" (defaults to config.ACTION_MODEL)
+        cost_model (str): "length" or "unit" (defaults to config.COST_MODEL)
+        heuristic (str): "blockers", "blocking_chain" or "pattern_database" (defaults to config.HEURISTIC)
+        report (function): Called with the record of every finished pass
+        stop (function): Gives the search up once it returns True (see STOPPABLE_ALGORITHMS)
+
+    Output:
+        SearchResult of the best solution, with stats["improvements"] listing every
+        pass that improved the cost or the bound (weight, cost, suboptimality bound
+        or None with an inadmissible heuristic, time, expanded nodes),
+        the final bound and whether the deadline was reached
+    """
+    # Start measuring time and memory
+    metrics = Metrics().start()
+
+    time_limit = config.ANYTIME_TIME_LIMIT if time_limit is None else time_limit
+    weight = config.ANYTIME_INITIAL_WEIGHT if weight is None else weight
+    weight_decay = config.ANYTIME_WEIGHT_DECAY if weight_decay is None else weight_decay
+
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(game_board, action_model, cost_model)
+    root = bitboard.initial_state
+    estimate = HeuristicCache(select_heuristic(bitboard, heuristic), config.HEURISTIC_CACHE_SIZE)
+    admissible = (heuristic or config.HEURISTIC) in ADMISSIBLE_HEURISTICS # Whether the bound holds
 
-    tracemalloc.stop()
-    return None, end_time-start_time, peak, num_expanded_node, None, None
\ No newline at end of file
+    best_g = {root: 0} # Cheapest known cost of every generated state
+    parents = {root: None} # Parent of every state on its cheapest known path
+    best_states, best_cost = ([root], 0) if bitboard.is_solved(root) else (None, math.inf)
+
+    node_counter = 0 # Used to break ties in the heap
+    num_expanded_node = 0 # Used to count expanded node
+    frontier = [(weight * estimate(root), node_counter, 0, root)]
+    closed = set() # States expanded in the current pass
+    inconsistent = set() # Expanded states whose cost improved during the current pass
+    improvements = []
+    deadline_reached = False
+
+    while True:
+        # Improve the current solution: expand while some state could lead to a cheaper one
+        while frontier and frontier[0][0] < best_cost:
+            if num_expanded_node % 64 == 0 and metrics.elapsed() > time_limit:
+                deadline_reached = True
+                break
+            if stop is not None and num_expanded_node % config.PROGRESS_INTERVAL == 0 and stop():
+                return cancelled_result(metrics, num_expanded_node, best_g, parents, frontier, estimate.values)
+
+            _, _, g, current_state = heapq.heappop(frontier)
+
+            # Skip outdated entries and states already expanded in this pass
+            if g != best_g[current_state] or current_state in closed:
+                continue
+            closed.add(current_state)
+            num_expanded_node += 1
+
+            for move in bitboard.moves(current_state):
+                next_state = bitboard.apply(current_state, move)
+                next_g = g + move[2]
+                if next_g >= best_g.get(next_state, math.inf):
+                    continue
+
+                best_g[next_state] = next_g
+                parents[next_state] = current_state
+
+                # A cheaper goal: keep its path (goals are never expanded)
+                if bitboard.is_solved(next_state):
+                    if next_g < best_cost:
+                        best_states, state = [], next_state
+                        while state is not None:
+                            best_states.append(state)
+                            state = parents[state]
+                        best_states.reverse()
+                        best_cost = sum(bitboard.move_between(a, b)[2] for a, b in zip(best_states, best_states[1:]))
+                    continue
+
+                if next_state in closed:
+                    inconsistent.add(next_state)
+                else:
+                    node_counter += 1
+                    heapq.heappush(frontier, (next_g + weight * estimate(next_state), node_counter, next_g, next_state))
+
+        # States still waiting for expansion (the frontier without outdated entries)
+        waiting = {state for _, _, g, state in frontier if g == best_g[state] and state not in closed} | inconsistent
+
+        # Suboptimality bound: the optimal cost is at least the smallest g + h still
+        # waiting, and a finished pass is also within its weight of the optimum.
+        # Both only hold if the heuristic never overestimates.
+        bound = None
+        if admissible:
+            lower_bound = min((best_g[state] + estimate(state) for state in waiting), default=best_cost)
+            bound = best_cost / lower_bound if lower_bound > 0 else math.inf
+            if not deadline_reached:
+                bound = 1.0 if not waiting else min(weight, bound)
+
+        # Report the pass if it improved the solution or its bound
+        if best_states is not None and (not improvements or improvements[-1]["cost"] != best_cost
+                                        or (bound is not None and not deadline_reached
+                                            and bound < improvements[-1]["bound"])):
+            record = {"weight": weight, "cost": best_cost, "bound": bound,
+                      "time": metrics.elapsed(), "expanded_nodes": num_expanded_node}
+            improvements.append(record)
+            if report is not None:
+                report(record)
+
+        # Weight 1 (or a bound of 1) ends the search: with an admissible heuristic,
+        # the solution is then optimal
+        if deadline_reached or weight <= 1 or (bound is not None and bound <= 1):
+            break
+
+        # Lower the weight (snapping to 1 once close), re-key the waiting states and start a new pass
+        weight = 1 + (weight - 1) * weight_decay
+        if weight < 1.05:
+            weight = 1.0
+        frontier = []
+        for state in waiting:
+            node_counter += 1
+            frontier.append((best_g[state] + weight * estimate(state), node_counter, best_g[state], state))
+        heapq.heapify(frontier)
+        closed = set()
+        inconsistent = set()
+
+    elapsed, peak = metrics.stop(best_g, parents, frontier, estimate.values)
+
+    stats = {"improvements": improvements, "deadline_reached": deadline_reached,
+             "bound": improvements[-1]["bound"] if improvements else None, "metrics": metrics.mode}
+    stats.update(estimate.stats())
+
+    # if no solution is found, return None
+    if best_states is None:
+        return SearchResult(None, elapsed, peak, num_expanded_node, None, None, stats)
+
+    path = [bitboard.to_gameboard(state) for state in best_states]
+    return SearchResult(path, elapsed, peak, num_expanded_node, len(path), best_cost, stats)
+
+# Retrograde (table lookup) algorithm
+def retrograde_algorithm(gameboard: Gameboard, action_model=None, cost_model=None, stop=None):
+    """
+    Solves the Rush Hour puzzle by looking up a retrograde distance table.
+
+    The first request for a level enumerates its whole reachable state space and
+    assigns every state its exact distance to the goal (see RetrogradeTable). The
+    table is kept for the session (and saved to config.RETROGRADE_CACHE_DIR when
+    set), so later requests for the level, from its initial or any intermediate
+    position, only follow the distances down to the goal.
+
+    Input:
+        gameboard (Gameboard): The configuration to solve
+        action_model (str): "step" or "slide" (defaults to config.ACTION_MODEL)
+        cost_model (str): "length" or "unit" (defaults to config.COST_MODEL)
+        stop (function): Gives the table build up once it returns True (see STOPPABLE_ALGORITHMS)
+
+    Output:
+        SearchResult with the table size and whether it was reused in its stats
+        (expanded nodes counts the states enumerated while building the table)
+    """
+    # Start measuring time and memory
+    metrics = Metrics().start()
+
+    # Build the bitboard engine for this level
+    bitboard = Bitboard(gameboard, action_model, cost_model)
+    root = bitboard.initial_state
+    signature = bitboard.signature()
+
+    # Reuse the table of this level if it covers the position, otherwise load or build it
+    table = retrograde_tables.get(signature)
+    reused = table is not None and root in table
+    expanded_nodes = 0
+    if not reused:
+        table = RetrogradeTable.load(config.RETROGRADE_CACHE_DIR, bitboard, root) if config.RETROGRADE_CACHE_DIR else None
+        if table is None:
+            table = RetrogradeTable(bitboard, root, stop=stop)
+            if table.ranks is None:
+                return cancelled_result(metrics, 0)
+            expanded_nodes = len(table)
+            if config.RETROGRADE_CACHE_DIR:
+                table.save(config.RETROGRADE_CACHE_DIR)
+        retrograde_tables[signature] = table
+
+    moves = table.solve(root)
+
+    elapsed, peak = metrics.stop(table.ranks, table.distances)
+
+    stats = {"table_states": len(table), "table_reused": reused, "metrics": metrics.mode}
+
+    # Return failure if the exit cannot be reached from this position
+    if moves is None:
+        return SearchResult(None, elapsed, peak, expanded_nodes, None, None, stats)
+
+    path = bitboard.replay(root, moves)
+    return SearchResult(path, elapsed, peak, expanded_nodes, len(path), sum(move[2] for move in moves), stats)
+
+# Algorithms available to headless tools, by function name
+ALGORITHMS = {algorithm.__name__: algorithm for algorithm in (
+    bfs_algorithm, dls_algorithm, iddfs_algorithm, ucs_algorithm, A_star_algorithm,
+    bidirectional_bfs_algorithm, bidirectional_ucs_algorithm, ida_star_algorithm, retrograde_algorithm,
+    parallel_bfs_algorithm, anytime_A_star_algorithm)}
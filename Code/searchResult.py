@@ -0,0 +1,12 @@
+from collections import namedtuple
+
+# SearchResult is the value returned by the search algorithms. It unpacks exactly
+# like the usual 6-tuple (path, time, peak memory, expanded nodes, moves, cost),
+# and additionally carries a dictionary of algorithm-specific statistics.
+class SearchResult(namedtuple('SearchResult', ['path', 'time', 'peak_memory', 'expanded_nodes', 'total_moves', 'total_cost'])):
+
+    # Constructor of SearchResult class
+    def __new__(cls, path, time, peak_memory, expanded_nodes, total_moves, total_cost, stats=None):
+        result = super().__new__(cls, path, time, peak_memory, expanded_nodes, total_moves, total_cost)
+        result.stats = stats if stats is not None else {}  # Extra statistics of the run
+        return result
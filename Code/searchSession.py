@@ -0,0 +1,174 @@
+import time
+from Code import config
+from Code.metrics import Metrics
+from Code.bitboard import Bitboard
+from Code.gameboard import Gameboard
+from Code.heuristicCache import HeuristicCache
+from Code.searchResult import SearchResult
+from Code.transpositionTable import TranspositionTable
+from Code.searchAlgorithms import bfs_steps, iddfs_steps, best_first_steps, select_heuristic
+
+# Algorithms a session can run, by the name of their blocking function
+SESSION_ALGORITHMS = ("bfs_algorithm", "iddfs_algorithm", "ucs_algorithm", "A_star_algorithm")
+
+# SearchSession runs a search a slice at a time, so a caller (a GUI, a service)
+# keeps control while it runs. The search is a generator that stops every
+# `interval` expanded nodes with a progress snapshot (expanded nodes, frontier
+# size, best f, time, memory); the session checks its budgets there, so a
+# budget may be overrun by at most one interval. Memory is measured by a Metrics
+# object, so its meaning depends on the metrics mode (RSS growth or traced bytes).
+# A session ends in one of three outcomes:
+#   "solved"     - a solution was found
+#   "unsolvable" - the search space was exhausted without reaching the exit
+#   "aborted"    - a node, time or memory budget ran out, or cancel() was called
+# Time counts only while the session advances, so a paused session keeps its budget.
+class SearchSession():
+
+    # Constructor of SearchSession class
+    def __init__(self, gameboard: Gameboard, algorithm="A_star_algorithm", action_model=None, cost_model=None,
+                 heuristic=None, max_nodes=None, time_limit=None, memory_limit=None, interval=None, metrics=None):
+        if algorithm not in SESSION_ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+        self.bitboard = Bitboard(gameboard, action_model, cost_model)
+        self.algorithm = algorithm        # Name of the algorithm being run
+        self.heuristic = heuristic        # Heuristic name of A* (defaults to config.HEURISTIC)
+        self.max_nodes = max_nodes        # Budget of expanded nodes (None: unlimited)
+        self.time_limit = time_limit      # Budget of seconds spent advancing (None: unlimited)
+        self.memory_limit = memory_limit  # Budget of bytes, as measured by the metrics (None: unlimited)
+        self.interval = interval or config.PROGRESS_INTERVAL  # Expanded nodes between snapshots
+
+        self.status = "running"           # "running", "solved", "unsolvable" or "aborted"
+        self.reason = None                # Why the search was aborted: "nodes", "time", "memory" or "cancelled"
+        self.snapshot = {"expanded_nodes": 0, "frontier": 1, "best_f": None, "time": 0.0, "memory": 0}
+        self.result = None                # SearchResult, once the session has ended
+        self.cancelled = False            # Set by cancel(), possibly from another thread
+        self.elapsed = 0.0                # Seconds spent advancing the search
+        self.peak = 0                     # Peak memory
+        self.metrics = Metrics(metrics)   # Memory measure ("fast" or "detailed", defaults to config.METRICS_MODE)
+        self.estimate = None              # Memoized heuristic of A*
+        self.steps = None                 # The search generator (created on the first slice)
+
+    # Create the search generator of the algorithm
+    def start(self):
+        bitboard = self.bitboard
+        if self.algorithm == "bfs_algorithm":
+            return bfs_steps(bitboard, self.interval)
+        if self.algorithm == "iddfs_algorithm":
+            table = TranspositionTable(config.TRANSPOSITION_TABLE_SIZE)
+            return iddfs_steps(bitboard, None, table, self.interval)
+        if self.algorithm == "ucs_algorithm":
+            return best_first_steps(bitboard, None, self.interval)
+
+        self.estimate = HeuristicCache(select_heuristic(bitboard, self.heuristic), config.HEURISTIC_CACHE_SIZE)
+        return best_first_steps(bitboard, self.estimate, self.interval)
+
+    # Ask the search to stop at its next snapshot (safe to call from another thread)
+    def cancel(self):
+        self.cancelled = True
+
+    # Budget exhausted by the latest snapshot (None if the search may go on)
+    def exceeded(self):
+        if self.cancelled:
+            return "cancelled"
+        if self.max_nodes is not None and self.snapshot["expanded_nodes"] >= self.max_nodes:
+            return "nodes"
+        if self.time_limit is not None and self.snapshot["time"] >= self.time_limit:
+            return "time"
+        if self.memory_limit is not None and self.snapshot["memory"] >= self.memory_limit:
+            return "memory"
+        return None
+
+    # Run the search until `nodes` more nodes are expanded or `seconds` have passed
+    # (by default, up to the next snapshot), or until it ends. Returns the latest snapshot.
+    def advance(self, nodes=None, seconds=None):
+        if self.status != "running":
+            return self.snapshot
+
+        # Memory is measured from the first slice until the session ends
+        if self.metrics.start_time is None:
+            self.metrics.start()
+
+        slice_start = time.perf_counter()
+        target = self.snapshot["expanded_nodes"] + (nodes or self.interval)
+
+        try:
+            if self.steps is None:
+                self.steps = self.start()
+
+            while True:
+                reason = self.exceeded()
+                if reason is not None:
+                    self.abort(reason, slice_start)
+                    break
+
+                snapshot = next(self.steps)
+                snapshot["time"] = self.elapsed + time.perf_counter() - slice_start
+                snapshot["memory"] = self.metrics.memory()
+                self.snapshot = snapshot
+
+                if seconds is not None:
+                    if time.perf_counter() - slice_start >= seconds:
+                        break
+                elif snapshot["expanded_nodes"] >= target:
+                    break
+        except StopIteration as stop:
+            self.finish(stop.value, slice_start)
+
+        if self.status == "running":
+            self.elapsed += time.perf_counter() - slice_start
+        return self.snapshot
+
+    # Advance until the session ends, calling progress(snapshot) after every slice.
+    # Returns the SearchResult, whose stats["status"] holds the outcome.
+    def run(self, progress=None):
+        while self.status == "running":
+            snapshot = self.advance()
+            if progress is not None and self.status == "running":
+                progress(snapshot)
+
+        return self.result
+
+    # Stop measuring memory and account the last slice
+    def stop(self, slice_start):
+        _, self.peak = self.metrics.stop()
+        self.elapsed += time.perf_counter() - slice_start
+
+    # End the session without an answer
+    def abort(self, reason, slice_start):
+        self.stop(slice_start)
+        self.status, self.reason = "aborted", reason
+        if self.steps is not None:
+            self.steps.close()
+
+        stats = {"status": "aborted", "reason": reason, "progress": self.snapshot, "metrics": self.metrics.mode}
+        self.result = SearchResult(None, self.elapsed, self.peak, self.snapshot["expanded_nodes"], None, None, stats)
+
+    # End the session with the value returned by the search generator
+    def finish(self, outcome, slice_start):
+        self.stop(slice_start)
+        bitboard = self.bitboard
+
+        # Each generator describes its answer in its own terms
+        cost = None
+        if self.algorithm == "bfs_algorithm":
+            goal_state, parents, expanded_nodes = outcome
+            stats = {}
+            path = bitboard.trace_path(parents, goal_state) if goal_state is not None else None
+        elif self.algorithm == "iddfs_algorithm":
+            moves, expanded_nodes, iterations = outcome
+            stats = {"iterations": iterations}
+            path = bitboard.replay(bitboard.initial_state, moves) if moves is not None else None
+        else:
+            goal_state, cost, parents, stats = outcome
+            expanded_nodes = stats["expanded_nodes"]
+            if self.estimate is not None:
+                stats.update(self.estimate.stats())
+            path = bitboard.trace_path(parents, goal_state) if goal_state is not None else None
+
+        self.status = "solved" if path is not None else "unsolvable"
+        stats["status"] = self.status
+        stats["metrics"] = self.metrics.mode
+        self.snapshot = dict(self.snapshot, expanded_nodes=expanded_nodes, time=self.elapsed)
+        self.result = SearchResult(path, self.elapsed, self.peak, expanded_nodes,
+                                   len(path) if path is not None else None, cost, stats)
@@ -0,0 +1,134 @@
+import os
+import json
+import time
+import sqlite3
+import inspect
+from Code import config
+from Code import helpFunctions
+from Code.bitboard import Bitboard
+from Code.gameboard import Gameboard
+from Code.searchResult import SearchResult
+
+# SolutionCache stores solved puzzles in a local sqlite database, so a level solved
+# once with an algorithm is answered from disk the next time.
+# Entries are keyed by a canonical encoding of the puzzle plus the algorithm, the
+# action model and the cost model. The encoding ignores vehicle IDs (only the red
+# car is marked), so relabelled but identical puzzles share their entries. Vehicles
+# are listed in matrix order, which is also the slot order of the Bitboard engine,
+# so the stored (slot, delta) move list replays on any relabelled copy.
+class SolutionCache():
+
+    # Constructor of SolutionCache class
+    def __init__(self, file_name):
+        self.file_name = file_name        # Path of the sqlite database file
+
+        directory = os.path.dirname(file_name)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self.connect() as connection:
+            connection.execute("""CREATE TABLE IF NOT EXISTS solutions (
+                puzzle TEXT, algorithm TEXT, action_model TEXT, cost_model TEXT,
+                moves TEXT, time REAL, peak_memory INTEGER, expanded_nodes INTEGER,
+                total_moves INTEGER, total_cost INTEGER, stats TEXT,
+                PRIMARY KEY (puzzle, algorithm, action_model, cost_model))""")
+
+    # Open a new connection (one per operation, so any thread may use the cache)
+    def connect(self):
+        return sqlite3.connect(self.file_name)
+
+    # Canonical encoding of a puzzle: board size, then every vehicle in matrix order
+    # as orientation, length and coordinates ('R' marks the red car), then the walls
+    @staticmethod
+    def canonical_key(gameboard: Gameboard):
+        vehicles = []
+        for info, position in zip(gameboard.table, gameboard.positions):
+            x, y = info.coordinates(int(position))
+            marker = "R" if info.id == '#' else ""
+            vehicles.append(f"{marker}{info.orientation}{info.length}@{x},{y}")
+
+        walls = [f"W@{x},{y}" for x, y in gameboard.walls]
+        return f"{gameboard.width}x{gameboard.height}:" + ";".join(vehicles + walls)
+
+    # Look up a stored result (None if this puzzle was never solved this way)
+    def get(self, gameboard: Gameboard, algorithm, action_model=None, cost_model=None):
+        bitboard = Bitboard(gameboard, action_model, cost_model)
+        key = (self.canonical_key(gameboard), algorithm, bitboard.action_model, bitboard.cost_model)
+
+        with self.connect() as connection:
+            row = connection.execute("""SELECT moves, time, peak_memory, expanded_nodes, total_moves,
+                total_cost, stats FROM solutions WHERE puzzle = ? AND algorithm = ? AND action_model = ?
+                AND cost_model = ?""", key).fetchone()
+        if row is None:
+            return None
+
+        moves, search_time, peak, expanded_nodes, total_moves, total_cost, stats = row
+        stats = json.loads(stats)
+        stats["cached"] = True
+
+        # Unsolvable puzzles are cached too
+        if moves is None:
+            return SearchResult(None, search_time, peak, expanded_nodes, None, None, stats)
+
+        # Rebuild the path by replaying the (slot, delta) moves on this gameboard
+        path = bitboard.replay(bitboard.initial_state, [
+            bitboard.forward_moves[slot][delta] if delta > 0 else bitboard.back_moves[slot][-delta]
+            for slot, delta in json.loads(moves)])
+        return SearchResult(path, search_time, peak, expanded_nodes, total_moves, total_cost, stats)
+
+    # Store the result of a search
+    def put(self, gameboard: Gameboard, algorithm, result, action_model=None, cost_model=None):
+        bitboard = Bitboard(gameboard, action_model, cost_model)
+        path, search_time, peak, expanded_nodes, total_moves, total_cost = result
+
+        # Compact move list: the (slot, delta) between consecutive gameboards of the path
+        moves = json.dumps(helpFunctions.path_to_moves(path)) if path else None
+
+        stats = json.dumps(getattr(result, "stats", {}), default=str)
+        row = (self.canonical_key(gameboard), algorithm, bitboard.action_model, bitboard.cost_model,
+               moves, search_time, peak, expanded_nodes, total_moves, total_cost, stats)
+
+        with self.connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+# Name under which an algorithm's results are cached, with the settings that change
+# its results: the configured heuristic of informed algorithms (and the pattern size
+# of the pattern databases), and the weights of ARA*
+def algorithm_key(algo_func):
+    parameters = inspect.signature(algo_func).parameters
+    settings = []
+    if "heuristic" in parameters:
+        settings.append(config.HEURISTIC)
+        if config.HEURISTIC == "pattern_database":
+            settings.append(f"pattern_size={config.PDB_PATTERN_SIZE}")
+    if "weight" in parameters:
+        settings.append(f"weight={config.ANYTIME_INITIAL_WEIGHT}")
+        settings.append(f"decay={config.ANYTIME_WEIGHT_DECAY}")
+
+    if settings:
+        return f"{algo_func.__name__}[{','.join(settings)}]"
+    return algo_func.__name__
+
+# Solve a gameboard with an algorithm, answering from the solution cache when possible
+# (config.SOLUTION_CACHE_FILE = None disables the cache). `solve` runs the search on a
+# miss (defaults to the algorithm itself). Aborted searches and searches cut short by
+# their deadline (ARA*) are not stored, since a longer run could do better.
+def solve_with_cache(algo_func, gameboard: Gameboard, solve=None):
+    solve = solve or algo_func
+    if not config.SOLUTION_CACHE_FILE:
+        return solve(gameboard)
+
+    cache = SolutionCache(config.SOLUTION_CACHE_FILE)
+    algorithm = algorithm_key(algo_func)
+
+    lookup_start = time.perf_counter()
+    result = cache.get(gameboard, algorithm)
+    if result is not None:
+        result.stats["lookup_time"] = time.perf_counter() - lookup_start
+        return result
+
+    result = solve(gameboard)
+    stats = getattr(result, "stats", {})
+    if stats.get("status") != "aborted" and not stats.get("deadline_reached"):
+        cache.put(gameboard, algorithm, result)
+    return result
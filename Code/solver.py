@@ -0,0 +1,129 @@
+import time
+
+# Time spent importing the solver stack, reported with the statistics (the
+# solver never imports pygame, so it starts fast on hosts without a display)
+IMPORT_START = time.perf_counter()
+
+import sys
+import argparse
+from Code import config
+from Code import helpFunctions
+from Code.metrics import MEMORY_LABELS
+from Code.searchAlgorithms import ALGORITHMS
+
+IMPORT_TIME = time.perf_counter() - IMPORT_START
+
+# Describe a (slot, delta) move of a gameboard, e.g. "A right 2"
+def describe_move(gameboard, slot, delta):
+    vehicle = gameboard.table[slot]
+    if vehicle.orientation == 'H':
+        direction = "right" if delta > 0 else "left"
+    else:
+        direction = "down" if delta > 0 else "up"
+    return f"{vehicle.id} {direction} {abs(delta)}"
+
+# Load a level file and solve it with an algorithm (by function name). Returns a
+# JSON-ready dictionary with the moves and statistics of the search. With `profile`,
+# loading, searching and extracting the moves are timed phase by phase (see
+# Code/profiler.py) and the profile is added to the statistics.
+def solve(file_name, algorithm, action_model=None, cost_model=None, heuristic=None, profile=False):
+    algo_func = ALGORITHMS[algorithm]
+
+    # Imported here: the profiler is only needed (and only imported) when profiling
+    if profile:
+        from Code.profiler import Profiler
+        profiler = Profiler().start()
+
+    try:
+        record = run(file_name, algorithm, algo_func, action_model, cost_model, heuristic)
+    finally:
+        if profile:
+            record_profile = profiler.stop()
+
+    if profile:
+        record["stats"]["profile"] = record_profile
+    return record
+
+# Body of solve(): load, search and describe the result
+def run(file_name, algorithm, algo_func, action_model, cost_model, heuristic):
+    gameboard = helpFunctions.load_gameboard(file_name)
+
+    # Only pass the options the algorithm accepts (e.g. heuristic is for A* / IDA*). The
+    # parameter names come from the code object: importing inspect would double the import time
+    options = {"action_model": action_model, "cost_model": cost_model, "heuristic": heuristic}
+    parameters = algo_func.__code__.co_varnames[:algo_func.__code__.co_argcount]
+    kwargs = {name: value for name, value in options.items() if value is not None and name in parameters}
+
+    result = algo_func(gameboard, **kwargs)
+    path, search_time, peak, expanded_nodes, total_moves, total_cost = result
+    moves = helpFunctions.path_to_moves(path) if path else None
+
+    return {"file": file_name, "algorithm": algorithm, "status": "solved" if path else "unsolvable",
+            "moves": [describe_move(gameboard, slot, delta) for slot, delta in moves] if path else None,
+            "time": search_time, "peak_memory": peak, "expanded_nodes": expanded_nodes,
+            "total_moves": total_moves, "total_cost": total_cost,
+            "import_time": IMPORT_TIME, "stats": getattr(result, "stats", {})}
+
+# Print a solve() record for people
+def print_record(record, output=sys.stdout):
+    print(f"Level: {record['file']}", file=output)
+    print(f"Algorithm: {record['algorithm']}", file=output)
+
+    if record["moves"] is None:
+        print("No solution", file=output)
+    else:
+        print(f"Solution ({len(record['moves'])} moves):", file=output)
+        for i, move in enumerate(record["moves"], 1):
+            print(f"  {i:3}. {move}", file=output)
+
+    print(f"Total time: {record['time']:.2f} seconds", file=output)
+    memory_label = MEMORY_LABELS.get(record["stats"].get("metrics"), MEMORY_LABELS["detailed"])
+    print(f"{memory_label}: {record['peak_memory'] / (1024 * 1024):.2f} MB", file=output)
+    print(f"Metrics: {record['stats'].get('metrics', 'detailed')}", file=output)
+    print(f"Total expanded nodes: {record['expanded_nodes']}", file=output)
+    print(f"Total moves: {record['total_moves']}", file=output)
+    print(f"Total cost: {record['total_cost']}", file=output)
+    print(f"Import time: {record['import_time'] * 1000:.1f} ms", file=output)
+
+    # Phases of a profiled solve, slowest first
+    profile = record["stats"].get("profile")
+    if profile:
+        print("Profile (calls, total time, self time):", file=output)
+        for phase, entry in profile["phases"].items():
+            print(f"  {phase:24} {entry['calls']:10} {entry['time']:10.4f}s {entry['self_time']:10.4f}s", file=output)
+
+# Command line entry point: python -m Code.solver Map/gameboard1.json --algorithm A_star_algorithm
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve one Rush Hour level file without the GUI.")
+    parser.add_argument("level", help="level file (e.g. Map/gameboard1.json)")
+    parser.add_argument("--algorithm", default="A_star_algorithm", choices=sorted(ALGORITHMS))
+    parser.add_argument("--action-model", choices=["step", "slide"], default=None)
+    parser.add_argument("--cost-model", choices=["length", "unit"], default=None)
+    parser.add_argument("--heuristic", choices=["blockers", "blocking_chain", "pattern_database"], default=None)
+    parser.add_argument("--metrics", choices=["fast", "detailed"], default=None,
+                        help="time and memory measures (default: config.METRICS_MODE)")
+    parser.add_argument("--profile", default=None, metavar="FILE",
+                        help="time every phase of the solve and write its folded stacks (flamegraph input) to FILE")
+    parser.add_argument("--json", action="store_true", help="print the result as one JSON object")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        config.METRICS_MODE = args.metrics
+
+    record = solve(args.level, args.algorithm, args.action_model, args.cost_model, args.heuristic,
+                   args.profile is not None)
+    if args.profile:
+        from Code.profiler import write_folded
+        write_folded(record["stats"]["profile"], args.profile)
+    if args.json:
+        import json  # Imported here: only the --json output needs it
+        print(json.dumps(record, default=str))
+    else:
+        print_record(record)
+
+    # Exit status 1 tells scripts that the level has no solution
+    return 0 if record["status"] == "solved" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
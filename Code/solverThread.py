@@ -0,0 +1,54 @@
+import time
+import threading
+from Code import solutionCache
+from Code.searchAlgorithms import STOPPABLE_ALGORITHMS
+from Code.searchSession import SearchSession, SESSION_ALGORITHMS
+
+# SolverThread solves a gameboard in a background thread, so the GUI keeps drawing
+# frames and handling events during long searches. The algorithms a SearchSession
+# can run report their expanded nodes while they search and stop soon after
+# cancel(); the other stoppable algorithms check cancel() through their stop
+# function. A cancelled thread's result is simply dropped by the GUI.
+class SolverThread(threading.Thread):
+
+    # Constructor of SolverThread class
+    def __init__(self, algo_func, gameboard):
+        super().__init__(daemon=True)
+        self.algo_func = algo_func        # Algorithm function to run
+        self.gameboard = gameboard        # Gameboard to solve
+        self.session = None               # SearchSession of the running search (if supported)
+        self.expanded_nodes = None        # Expanded nodes so far (None when not reported)
+        self.start_time = time.perf_counter()  # When the search was started
+        self.cancelled = False            # Whether cancel() was called
+        self.result = None                # SearchResult once the thread has finished
+        self.error = None                 # Exception raised by the search, if any
+
+    # Solve the gameboard, answering from the solution cache when possible
+    def run(self):
+        try:
+            self.result = solutionCache.solve_with_cache(self.algo_func, self.gameboard, self.solve)
+        except Exception as error:
+            self.error = error
+
+    # Run the search itself, through a session when the algorithm supports one
+    def solve(self, gameboard):
+        if self.algo_func.__name__ in STOPPABLE_ALGORITHMS:
+            return self.algo_func(gameboard, stop=lambda: self.cancelled)
+        if self.algo_func.__name__ not in SESSION_ALGORITHMS:
+            return self.algo_func(gameboard)
+
+        self.session = SearchSession(gameboard, self.algo_func.__name__)
+        self.expanded_nodes = 0
+        if self.cancelled:
+            self.session.cancel()
+        return self.session.run(self.report)
+
+    # Record the progress of the session
+    def report(self, snapshot):
+        self.expanded_nodes = snapshot["expanded_nodes"]
+
+    # Ask the search to stop
+    def cancel(self):
+        self.cancelled = True
+        if self.session is not None:
+            self.session.cancel()
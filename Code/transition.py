@@ -1,4 +1,3 @@
-from Code import config
 from Code.vehicle import Vehicle
 from Code.gameboard import Gameboard
 
@@ -74,4 +73,4 @@ def interpolate_gameboard(state1, state2, progress):
             interpolated_vehicles.append(v1)
 
     # Return new gameboard with interpolated vehicles
-    return Gameboard(config.GAMEBOARD_WIDTH, config.GAMEBOARD_HEIGHT, interpolated_vehicles)
+    return Gameboard(state1.width, state1.height, interpolated_vehicles, state1.walls)
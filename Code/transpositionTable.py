@@ -0,0 +1,36 @@
+# TranspositionTable is a fixed-size hash table for depth-first searches.
+# Each state maps to one slot; a new entry always replaces the previous occupant
+# of its slot, so memory stays bounded however large the search.
+class TranspositionTable():
+
+    # Constructor of TranspositionTable class (size is rounded up to a power of two)
+    def __init__(self, size):
+        bits = max(1, (size - 1).bit_length())
+        size = 1 << bits
+        self.size = size                  # Number of slots in the table
+        self.shift = 64 - bits            # Shift taking the top bits of the mixed hash
+        self.keys = [None] * size         # State stored in each slot
+        self.values = [0] * size          # Value stored with each state
+        self.hits = 0                     # Lookups that found their state
+        self.misses = 0                   # Lookups that did not find their state
+
+    # Slot of a state. Bitboard states differ mostly in their high bits, so the hash
+    # is mixed by Fibonacci hashing instead of keeping only its low bits
+    def index(self, state):
+        return ((hash(state) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self.shift
+
+    # Return the value stored for a state, or None if it is not in the table
+    def get(self, state):
+        index = self.index(state)
+        if self.keys[index] == state:
+            self.hits += 1
+            return self.values[index]
+
+        self.misses += 1
+        return None
+
+    # Store a value for a state (replacing whatever occupied its slot)
+    def store(self, state, value):
+        index = self.index(state)
+        self.keys[index] = state
+        self.values[index] = value
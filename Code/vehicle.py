@@ -13,12 +13,56 @@ class Vehicle():
         # Format: ID + X + Y + Orientation (e.g., 'A23H')
         return "'{0}{1}{2}{3}'".format(self.id, self.x, self.y, self.orientation)
 
-    # Hash the vehicle with the representative string
+    # Hash the vehicle with the fields compared by __eq__
     def __hash__(self):
         # Enable use of vehicle in sets or as dictionary keys
-        return hash(self.__repr__())
+        return hash((self.id, self.x, self.y, self.orientation))
 
     # Compare two hashed vehicles
     def __eq__(self, other):
         # Two vehicles are considered equal if ID, position, and orientation match
         return self.id == other.id and self.x == other.x and self.y == other.y and self.orientation == other.orientation
+
+
+# VehicleInfo holds the data of a vehicle that never changes during a level.
+# It is shared by every state of that level, which only stores positions.
+class VehicleInfo():
+    __slots__ = ('id', 'orientation', 'length', 'lane', 'zobrist')
+
+    # Constructor of VehicleInfo class
+    def __init__(self, id, orientation, length, lane, lane_size):
+        self.id = id                      # Unique identifier for the vehicle (e.g. 'A', 'B', '#')
+        self.orientation = orientation    # Orientation: 'H' for horizontal, 'V' for vertical
+        self.length = int(length)         # Length of the vehicle (number of grid cells)
+        self.lane = lane                  # Fixed row (horizontal) or column (vertical) of the vehicle
+
+        # Zobrist key of every position along the lane. Keys depend only on the vehicle's
+        # data, so equal boards hash equally even when built from different tables.
+        self.zobrist = tuple(hash((id, orientation, self.length, lane, p)) for p in range(lane_size))
+
+    # Build the static part of a Vehicle object on a board of the given size
+    @classmethod
+    def from_vehicle(cls, vehicle, width, height):
+        if vehicle.orientation == 'H':
+            return cls(vehicle.id, vehicle.orientation, vehicle.length, vehicle.y, width)
+        return cls(vehicle.id, vehicle.orientation, vehicle.length, vehicle.x, height)
+
+    # Movable coordinate of a Vehicle object along this lane
+    def position_of(self, vehicle):
+        return vehicle.x if self.orientation == 'H' else vehicle.y
+
+    # Convert a lane position into (x, y) grid coordinates
+    def coordinates(self, position):
+        if self.orientation == 'H':
+            return position, self.lane
+        return self.lane, position
+
+    # Create a Vehicle object placed at a lane position
+    def to_vehicle(self, position):
+        x, y = self.coordinates(position)
+        return Vehicle(self.id, x, y, self.orientation, self.length)
+
+    # Represents the vehicle info as a string
+    def __repr__(self):
+        # Format: ID + Orientation + Length + Lane (e.g., 'AH2@3')
+        return "'{0}{1}{2}@{3}'".format(self.id, self.orientation, self.length, self.lane)
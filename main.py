@@ -4,6 +4,7 @@ from Code import config
 from Code import gameStates
 from Code import gameButtons
 from Code import renderFunctions
+from Code import algorithmControl
 
 # Initialize PyGame and configure screen
 pygame.init()
@@ -73,6 +74,11 @@ if __name__ == "__main__":
         if states["show_algo_selector"]:
             renderFunctions.render_algorithm_overlay(SCREEN, select_algo_background, buttons["close_algo_selector_button"], algorithm_buttons)
 
+        # Collect the results of a finished search, or show the progress of a running one
+        algorithmControl.poll_solver(states)
+        if states["solver_thread"]:
+            renderFunctions.render_search_progress(states, SCREEN, FONT, buttons["cancel_search_button"])
+
         # Show "No solution found" message if applicable
         if states["no_solution_flag"]:
             renderFunctions.render_no_solution(states, SCREEN, DETAIL_TITLE_FONT)